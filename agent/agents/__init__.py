@@ -0,0 +1,45 @@
+"""
+Agents package: exposes a fan-out helper for running several sub-agents
+concurrently over independent queries.
+"""
+import asyncio
+import os
+from typing import List, Tuple
+
+from agent.agents.mail_agent import execute_mail_agent
+from agent.agents.calendar_agent import execute_calendar_agent
+from agent.agents.expense_tracker_agent import execute_expense_agent
+
+
+# Max sub-agents in flight at once; each one holds a Gemini session, so this
+# also bounds request rate against the API (tune via AGENT_CONCURRENCY)
+AGENT_CONCURRENCY = int(os.getenv("AGENT_CONCURRENCY", "3"))
+
+
+_AGENTS = {
+    "mail": execute_mail_agent,
+    "calendar": execute_calendar_agent,
+    "expense": execute_expense_agent,
+}
+
+
+async def run_agents(jobs: List[Tuple[str, str]]) -> List[str]:
+    """
+    Run multiple sub-agents concurrently (fan-out/fan-in).
+
+    Args:
+        jobs: List of (agent_name, query) pairs where agent_name is one of
+              "mail", "calendar", "expense"
+
+    Returns:
+        List of responses in the same order as jobs
+    """
+    semaphore = asyncio.Semaphore(AGENT_CONCURRENCY)
+
+    async def _run(agent_name: str, query: str) -> str:
+        executor = _AGENTS.get(agent_name)
+        if executor is None:
+            return f"Error: unknown agent '{agent_name}'"
+        return await executor(query, semaphore=semaphore)
+
+    return await asyncio.gather(*[_run(name, query) for name, query in jobs])
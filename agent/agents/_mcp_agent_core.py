@@ -0,0 +1,410 @@
+"""
+Shared tool-calling loop for the MCP-backed sub-agents.
+
+The calendar, expense, and mail agents all run the same dance: connect to
+their MCP server, bind the discovered tools to Gemini, loop on tool calls,
+and publish an eval event with the final answer. Keeping one copy here
+means optimizations (connection reuse, tool caching, parallel tool calls)
+reach every agent at once.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from mcp.types import TextContent
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+
+from agent.agents.mcp_clients import get_client
+from agent.agents.mcp_tool_cache import get_tools
+from agent.eval_queue import publish_eval_event_nowait
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ITERATIONS = 10
+
+# Gate all Gemini calls across every agent in the process; unbounded
+# fan-out bursts past the RPM limit and the resulting 429 retries are
+# slower than just queueing here.
+_GEMINI_SEM = asyncio.Semaphore(int(os.getenv("GEMINI_CONCURRENCY", "8")))
+_MAX_LLM_RETRIES = 3
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    """True when the provider rejected the call for quota/rate reasons."""
+    return exc.__class__.__name__ == "ResourceExhausted" or "429" in str(exc)
+
+# One LLM per process; constructing ChatGoogleGenerativeAI re-runs credential
+# setup and Pydantic validation, so don't pay that per request.
+_LLM: Optional[ChatGoogleGenerativeAI] = None
+_LLM_KEY: Optional[tuple] = None
+
+# bind_tools output cached by tool-schema hash; the tool list for a given
+# MCP server is stable, so in steady state this is a single dict lookup.
+_BOUND: Dict[str, Any] = {}
+
+
+# Compress old tool outputs once the transcript passes this size (chars,
+# roughly tokens*4); the most recent tool results always stay intact.
+_COMPRESS_THRESHOLD_CHARS = 30_000
+_KEEP_RECENT_TOOL_MSGS = 2
+
+
+def _summarize_tool_content(name: str, content: str) -> str:
+    """Short placeholder for a stale tool payload the model already used."""
+    try:
+        data = orjson.loads(content)
+        if isinstance(data, list):
+            return f"<omitted: {name} returned {len(data)} items>"
+        if isinstance(data, dict):
+            return f"<omitted: {name} returned {len(data)} fields>"
+    except Exception:
+        pass
+    return f"<omitted: {name} returned {len(content)} chars>"
+
+
+def _compress_stale_tool_messages(messages: List[Any]) -> None:
+    """
+    Replace the content of all but the most recent ToolMessages with short
+    placeholders once the transcript exceeds the size threshold. Prefill
+    cost scales with prompt tokens, and by late iterations the prompt is
+    dominated by old tool payloads the model has already summarized.
+    """
+    total = sum(len(m.content) for m in messages if isinstance(m.content, str))
+    if total <= _COMPRESS_THRESHOLD_CHARS:
+        return
+
+    tool_indices = [i for i, m in enumerate(messages) if isinstance(m, ToolMessage)]
+    for i in tool_indices[:-_KEEP_RECENT_TOOL_MSGS]:
+        old = messages[i]
+        if isinstance(old.content, str) and not old.content.startswith("<omitted:"):
+            messages[i] = ToolMessage(
+                content=_summarize_tool_content(old.name, old.content),
+                tool_call_id=old.tool_call_id,
+                name=old.name
+            )
+
+
+def _tool_succeeded(content: Any) -> bool:
+    """
+    True when a tool result parses as a JSON object without an "error" key.
+
+    Success payloads vary per server ({"deleted": ...}, {"sent": ...}, the
+    raw API body for expense deletes), but every MCP tool wrapper reports
+    failure as {"error": ...} — absence of that key is the one invariant
+    shared by all terminal tools.
+    """
+    if not isinstance(content, str):
+        return False
+    try:
+        data = orjson.loads(content)
+    except Exception:
+        return False
+    return isinstance(data, dict) and "error" not in data
+
+
+def _finalize(
+    final_response: str,
+    agent_name: str,
+    query: str,
+    category: str,
+    extra_meta: Optional[Dict[str, Any]],
+    start_time: float,
+    cache_key: Optional[Tuple[str, str, str, int]],
+) -> str:
+    """Publish the eval event, update the response cache, return the reply."""
+    execution_time = (time.time() - start_time) * 1000
+    metadata: Dict[str, Any] = {"execution_time_ms": execution_time}
+    if extra_meta:
+        metadata.update(extra_meta)
+    publish_eval_event_nowait(
+        agent_name=agent_name,
+        query=query,
+        response=final_response,
+        category=category,
+        metadata=metadata
+    )
+
+    if cache_key is not None:
+        _RESP_CACHE[cache_key] = final_response
+        _RESP_CACHE.move_to_end(cache_key)
+        while len(_RESP_CACHE) > _RESP_CACHE_MAX:
+            _RESP_CACHE.popitem(last=False)
+
+    return final_response
+
+
+def _get_llm(model_name: str, api_key: str) -> ChatGoogleGenerativeAI:
+    """Return the shared LLM instance, rebuilding it only if config changed."""
+    global _LLM, _LLM_KEY
+    key = (model_name, api_key)
+    if _LLM is None or _LLM_KEY != key:
+        _LLM = ChatGoogleGenerativeAI(
+            model=model_name,
+            google_api_key=api_key,
+            temperature=0.7
+        )
+        _LLM_KEY = key
+    return _LLM
+
+
+# Short-lived LRU for repeat read-only queries ("what's on my calendar
+# today"), keyed per agent and ~10-minute time bucket so entries rotate
+# out on their own. Admission is allowlist-gated twice: the query has to
+# look like a question/lookup up front, and the run has to stay read-only
+# in hindsight — every tool it actually calls must match the read-only
+# tool allowlist. A blocklist of mutating verbs proved too leaky ("add",
+# "mark", "pay", ... all slipped through and replayed stale answers
+# instead of executing the second mutation). A per-agent generation
+# counter is folded into the key and bumped on every mutating tool call,
+# so a write invalidates all of that agent's cached answers instead of
+# letting "list my expenses" replay a pre-write listing for the rest of
+# the bucket; orphaned generations rotate out via the LRU bound.
+_RESP_CACHE: "OrderedDict[Tuple[str, str, str, int], str]" = OrderedDict()
+_RESP_CACHE_MAX = 256
+_RESP_CACHE_GEN: Dict[str, int] = {}
+_READ_ONLY_QUERY_RE = re.compile(
+    r"^\s*(?:what|when|who|which|where|how|show|list|view|display|find|search|check|do|does|did|is|are|any)\b",
+    re.I,
+)
+_READ_ONLY_TOOL_RE = re.compile(r"^(?:get|read|list|search|check)", re.I)
+
+
+def _response_cache_key(agent_name: str, query: str) -> Tuple[str, str, str, int]:
+    """Cache key for a read-only query: agent, normalized text, time
+    bucket, and the agent's current write generation."""
+    bucket = datetime.utcnow().strftime("%Y%m%d%H%M")[:11]
+    return (agent_name, query.strip().lower(), bucket, _RESP_CACHE_GEN.get(agent_name, 0))
+
+
+def _get_bound_llm(model_name: str, api_key: str, langchain_tools: List[Dict[str, Any]]):
+    """Return the LLM with tools bound, reusing the binding for a stable tool set."""
+    tools_key = hashlib.blake2b(
+        orjson.dumps(langchain_tools, option=orjson.OPT_SORT_KEYS, default=str)
+    ).hexdigest()
+    cache_key = f"{model_name}:{tools_key}"
+    bound = _BOUND.get(cache_key)
+    if bound is None:
+        bound = _get_llm(model_name, api_key).bind_tools(langchain_tools)
+        _BOUND[cache_key] = bound
+    return bound
+
+
+async def run_mcp_agent(
+    mcp_url: str,
+    system_prompt: Any,
+    agent_name: str,
+    query: str,
+    *,
+    category: str,
+    extra_meta: Optional[Dict[str, Any]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    stream_cb: Optional[Callable[[str], None]] = None,
+    terminal_tools: Optional[frozenset] = None,
+) -> str:
+    """
+    Run the generic MCP sub-agent loop.
+
+    Args:
+        mcp_url: URL of the MCP server providing this agent's tools
+        system_prompt: Agent-specific system prompt, as a plain string or a
+            prebuilt SystemMessage
+        agent_name: Name used in logs and eval events (e.g. "calendar_agent")
+        query: The user's query for this agent
+        category: Eval event category (e.g. "calendar")
+        extra_meta: Extra metadata merged into the eval event
+        semaphore: Optional semaphore bounding concurrent LLM calls when
+            several agents run in parallel
+        stream_cb: Optional callback receiving response text chunks as they
+            are generated; the full response is still returned at the end
+        terminal_tools: Tool names whose successful result ends the
+            conversation; a confirmation is synthesized locally instead of
+            spending another LLM round-trip on phrasing it
+
+    Returns:
+        The agent's final response text
+    """
+    start_time = time.time()
+    label = agent_name.replace("_", " ")
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    model_name = os.getenv("GEMINI_MODEL")
+
+    if not api_key:
+        return "Error: GEMINI_API_KEY is not set."
+
+    if not model_name:
+        return "Error: GEMINI_MODEL is not set."
+
+    # Serve repeat read-only queries from the response cache; only
+    # allowlisted lookup-shaped queries are eligible, and the key is
+    # dropped below if the run calls any tool that is not read-only
+    cache_key = None
+    if _READ_ONLY_QUERY_RE.match(query):
+        cache_key = _response_cache_key(agent_name, query)
+        cached = _RESP_CACHE.get(cache_key)
+        if cached is not None:
+            _RESP_CACHE.move_to_end(cache_key)
+            if stream_cb is not None:
+                stream_cb(cached)
+            return cached
+
+    try:
+        # Reuse the long-lived MCP connection for this server
+        client = await get_client(mcp_url)
+
+        # Get tools (cached per MCP URL) in LangChain format
+        tools, langchain_tools = await get_tools(client, mcp_url)
+        logger.debug("%s: connected to MCP at %s, %d tools available", agent_name, mcp_url, len(tools))
+
+        # Shared LLM with tools bound (both cached across requests)
+        llm_with_tools = _get_bound_llm(model_name, api_key, langchain_tools)
+
+        # Pre-merge the system prompt into the first human turn. This is
+        # what convert_system_message_to_human=True did inside the LangChain
+        # adapter, except the adapter re-walked and rebuilt the message list
+        # on every ainvoke; doing it once here removes that per-iteration scan.
+        if isinstance(system_prompt, SystemMessage):
+            system_text = system_prompt.content
+        else:
+            system_text = system_prompt
+        messages = [
+            HumanMessage(content=f"{system_text}\n\n---\nUser: {query}")
+        ]
+
+        async def _run_one(tool_call: Dict[str, Any]) -> ToolMessage:
+            """Execute one tool call via MCP and wrap the result in a ToolMessage."""
+            tool_name = tool_call.get("name", "")
+            tool_args = tool_call.get("args", {})
+            tool_call_id = tool_call.get("id", tool_name)
+
+            # Execute tool via MCP client
+            try:
+                result = await client.call_tool(tool_name, tool_args)
+
+                # Extract content from CallToolResult; dispatch on the known
+                # MCP content type instead of hasattr probing, and pass text
+                # payloads through verbatim
+                content = getattr(result, "content", None)
+                content_item = content[0] if content else None
+                if isinstance(content_item, TextContent):
+                    result_content = content_item.text
+                elif content_item is not None:
+                    result_content = str(content_item)
+                else:
+                    result_content = str(result)
+
+            except Exception as e:
+                result_content = orjson.dumps({"error": str(e)}).decode()
+                logger.error("Error calling tool %s: %s", tool_name, e)
+
+            return ToolMessage(
+                content=result_content,
+                tool_call_id=tool_call_id,
+                name=tool_name
+            )
+
+        async def _call_llm():
+            """One model turn: blocking ainvoke, or astream when a callback wants tokens."""
+            if stream_cb is None:
+                return await llm_with_tools.ainvoke(messages)
+
+            # Stream chunks, forwarding content as long as no tool call has
+            # started; the aggregated message is still used by the loop
+            response = None
+            async for chunk in llm_with_tools.astream(messages):
+                response = chunk if response is None else response + chunk
+                if chunk.content and not getattr(response, "tool_call_chunks", None):
+                    stream_cb(chunk.content)
+            return response
+
+        async def _model_turn():
+            """Run one model turn under the global Gemini gate, retrying
+            rate-limit rejections with jittered exponential backoff."""
+            for attempt in range(_MAX_LLM_RETRIES + 1):
+                try:
+                    async with _GEMINI_SEM:
+                        return await _call_llm()
+                except Exception as e:
+                    if attempt >= _MAX_LLM_RETRIES or not _is_rate_limit(e):
+                        raise
+                    delay = (2 ** attempt) + random.uniform(0, 1)
+                    logger.warning("%s: rate limited, retrying in %.1fs", agent_name, delay)
+                    await asyncio.sleep(delay)
+
+        # Tool calling loop
+        iterations = 0
+
+        while iterations < MAX_ITERATIONS:
+            iterations += 1
+
+            if semaphore is not None:
+                async with semaphore:
+                    response = await _model_turn()
+            else:
+                response = await _model_turn()
+
+            # Check if model wants to call tools
+            if response is None or not response.tool_calls:
+                # Return final response
+                final_response = response.content if response is not None and response.content else "Task completed."
+                return _finalize(
+                    final_response, agent_name, query, category, extra_meta,
+                    start_time, cache_key
+                )
+
+            # Add AI response to messages
+            messages.append(response)
+
+            # One mutating call makes this run uncacheable and bumps the
+            # agent's generation, invalidating every answer cached before
+            # the write — later reads must hit the backend, not the cache
+            if any(
+                not _READ_ONLY_TOOL_RE.match(tool_call.get("name", ""))
+                for tool_call in response.tool_calls
+            ):
+                _RESP_CACHE_GEN[agent_name] = _RESP_CACHE_GEN.get(agent_name, 0) + 1
+                cache_key = None
+
+            # Execute independent tool calls concurrently; gather preserves
+            # input order so tool_call_id pairing stays intact
+            tool_messages = await asyncio.gather(
+                *[_run_one(tool_call) for tool_call in response.tool_calls]
+            )
+            messages.extend(tool_messages)
+
+            # Keep prefill cost flat on long runs
+            _compress_stale_tool_messages(messages)
+
+            # If every tool in the batch was terminal and succeeded, the
+            # model's follow-up would be a trivial confirmation — synthesize
+            # it locally and save the extra Gemini round-trip
+            if terminal_tools and all(
+                tool_call.get("name") in terminal_tools
+                for tool_call in response.tool_calls
+            ):
+                if all(_tool_succeeded(msg.content) for msg in tool_messages):
+                    final_response = "; ".join(
+                        f"{tool_call.get('name', 'operation').replace('_', ' ').capitalize()} completed successfully"
+                        for tool_call in response.tool_calls
+                    ) + "."
+                    if stream_cb is not None:
+                        stream_cb(final_response)
+                    return _finalize(
+                        final_response, agent_name, query, category, extra_meta,
+                        start_time, cache_key
+                    )
+
+        return f"{label.capitalize()} completed but reached iteration limit."
+
+    except Exception as e:
+        return f"Error in {label}: {str(e)}"
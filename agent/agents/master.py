@@ -1,10 +1,15 @@
 """
 Master Supervisor Agent: Coordinates sub-agents using LangChain's supervisor pattern
 """
-import json
+import asyncio
+import inspect
+import logging
 import os
+from collections import deque
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -15,26 +20,178 @@ from agent.agents.sub_agent_tools import SUB_AGENT_TOOLS
 
 load_dotenv()
 
+# Env config is fixed for the process lifetime; read it once rather than
+# walking os.environ on every request
+_API_KEY = os.getenv("GEMINI_API_KEY")
+_MODEL_NAME = os.getenv("GEMINI_MODEL")
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(obj: Any) -> str:
+    """orjson-backed json.dumps; several times faster on tool payloads."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+
+def _loads(s: Any) -> Any:
+    return orjson.loads(s)
+
+
+# O(1) tool resolution instead of scanning SUB_AGENT_TOOLS per call
+_TOOL_BY_NAME = {tool.name: tool for tool in SUB_AGENT_TOOLS}
+
+# Once the cached LangChain transcript grows past this, rebuild it from the
+# capped history instead of letting it grow without bound
+_PREFIX_MAX_MESSAGES = 80
+
+# Supervisor LLM (with tools bound) reused across turns; rebuilding it per
+# request re-read env config and re-initialized the underlying channels
+_LLM_CACHE: Dict[tuple, Any] = {}
+
+
+def _get_llm_with_tools(model_name: str, api_key: str) -> Any:
+    key = (model_name, api_key)
+    llm_with_tools = _LLM_CACHE.get(key)
+    if llm_with_tools is None:
+        llm = ChatGoogleGenerativeAI(
+            model=model_name,
+            google_api_key=api_key,
+            temperature=0.7,
+            convert_system_message_to_human=True
+        )
+        llm_with_tools = llm.bind_tools(SUB_AGENT_TOOLS)
+        _LLM_CACHE[key] = llm_with_tools
+    return llm_with_tools
+
+# Cap concurrent sub-agent executions when the supervisor delegates to
+# several tools in one turn
+_TOOL_CONCURRENCY = asyncio.Semaphore(int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8")))
+
+
+async def _execute_tool_call(tool_call: Dict[str, Any]) -> str:
+    """Run one sub-agent tool call and return its result content; errors are
+    isolated into {"error": ...} JSON strings."""
+    tool_name = tool_call.get("name", "")
+    tool_args = tool_call.get("args", {})
+
+    try:
+        tool_func = _TOOL_BY_NAME.get(tool_name)
+
+        if tool_func:
+            # Execute the sub-agent
+            async with _TOOL_CONCURRENCY:
+                result = await tool_func.ainvoke(tool_args)
+            return result if isinstance(result, str) else _dumps(result)
+        return _dumps({"error": f"Unknown tool: {tool_name}"})
+    except Exception as e:
+        logger.error("Error calling sub-agent %s: %s", tool_name, e)
+        return _dumps({"error": str(e)})
+
 
 # --- History helpers (cap at 40) ---
-def push_history(state: AssistantState, role: str, content: str, name: Optional[str] = None) -> AssistantState:
-    history: List[Message] = list(state.get("history", []))  # type: ignore[assignment]
+HISTORY_MAX = 40
+
+
+def push_history(
+    state: AssistantState,
+    role: str,
+    content: str,
+    name: Optional[str] = None,
+    structured: Any = None,
+) -> AssistantState:
+    # deque appends are O(1) and old entries fall off automatically; the
+    # old list-copy-then-slice paid an O(n) copy on every push
+    history = state.get("history")
+    if not isinstance(history, deque):
+        history = deque(history or [], maxlen=HISTORY_MAX)
     msg: Message = {"role": role, "content": content, "name": name}  # type: ignore
+    if not isinstance(content, str):
+        # Serialize once at push time; the history replay runs on every
+        # supervisor turn and shouldn't re-encode the same payload
+        try:
+            msg["_content_str"] = _dumps(content)  # type: ignore[typeddict-unknown-key]
+        except Exception:
+            msg["_content_str"] = str(content)  # type: ignore[typeddict-unknown-key]
+    if structured is not None:
+        # Canonical structured form stored as-is; serialized only when the
+        # transcript is replayed to the LLM
+        msg["structured_response"] = structured  # type: ignore[typeddict-unknown-key]
     history.append(msg)
-    # cap to last 40
-    if len(history) > 40:
-        history = history[-40:]
-    state["history"] = history
+    state["history"] = history  # type: ignore[typeddict-item]
     return state
 
 
 def get_recent_history(state: AssistantState, limit: int = 40) -> List[Message]:
-    history: List[Message] = list(state.get("history", []))  # type: ignore[assignment]
+    history = list(state.get("history", []) or [])
     if limit and len(history) > limit:
         return history[-limit:]
     return history
 
 
+def _msg_content_str(msg: Message) -> str:
+    """Content as a string; non-string content was serialized at push time,
+    with an encode-on-read fallback for entries that predate that."""
+    content = msg.get("content", "")
+    if isinstance(content, str):
+        return content
+    cached_str = msg.get("_content_str")
+    if isinstance(cached_str, str):
+        return cached_str
+    try:
+        return _dumps(content)
+    except Exception:
+        return str(content)
+
+
+def _h_user(msg: Message) -> Optional[HumanMessage]:
+    content = _msg_content_str(msg)
+    # Skip empty user messages
+    return HumanMessage(content=content) if content else None
+
+
+def _h_ai(msg: Message) -> Optional[AIMessage]:
+    # A function_call entry is a tool call from the assistant
+    function_call = msg.get("function_call")
+    if function_call:
+        tool_calls = [{
+            "name": function_call["name"],
+            "args": function_call.get("args", {}),
+            "id": msg.get("tool_call_id", function_call["name"])
+        }]
+        return AIMessage(content="", tool_calls=tool_calls)
+    content = _msg_content_str(msg)
+    # Regular assistant message
+    return AIMessage(content=content) if content else None
+
+
+def _h_tool(msg: Message) -> ToolMessage:
+    tool_name = msg.get("name") or msg.get("tool_name", "tool")
+    tool_call_id = msg.get("tool_call_id", tool_name)
+
+    # Serialize the structured form once if present; otherwise the stored
+    # content string is already what the LLM should see
+    structured_response = msg.get("structured_response")
+    if structured_response is not None and not isinstance(structured_response, str):
+        tool_content = _dumps(structured_response)
+    else:
+        tool_content = structured_response if isinstance(structured_response, str) else _msg_content_str(msg)
+
+    return ToolMessage(
+        content=tool_content,
+        tool_call_id=tool_call_id,
+        name=tool_name
+    )
+
+
+# Dict dispatch on role instead of chained if/elif per message
+_ROLE_HANDLERS = {
+    "user": _h_user,
+    "assistant": _h_ai,
+    "model": _h_ai,
+    "tool": _h_tool,
+}
+
+
 def _build_langchain_messages_from_history(
     history: List[Message],
     query: str,
@@ -43,69 +200,22 @@ def _build_langchain_messages_from_history(
     """
     Build LangChain message list from history.
     """
-    messages = []
-    
-    # Add system prompt
-    messages.append(SystemMessage(content=system_prompt))
-    
-    # Process history (last 40 messages)
-    for msg in (history or [])[-40:]:
-        role = msg.get("role")
-        content = msg.get("content", "")
-        
-        # Convert content to string if needed
-        if not isinstance(content, str):
-            try:
-                content = json.dumps(content, ensure_ascii=False)
-            except Exception:
-                content = str(content)
-        
-        if role == "user":
-            if content:  # Skip empty user messages
-                messages.append(HumanMessage(content=content))
-        
-        elif role in ("assistant", "model"):
-            # Check if this is a function call
-            function_call = msg.get("function_call")
-            if function_call:
-                # This is a tool call from the assistant
-                tool_calls = [{
-                    "name": function_call["name"],
-                    "args": function_call.get("args", {}),
-                    "id": msg.get("tool_call_id", function_call["name"])
-                }]
-                ai_msg = AIMessage(content="", tool_calls=tool_calls)
-                messages.append(ai_msg)
-            elif content:
-                # Regular assistant message
-                messages.append(AIMessage(content=content))
-        
-        elif role == "tool":
-            # Tool result
-            tool_name = msg.get("name") or msg.get("tool_name", "tool")
-            tool_call_id = msg.get("tool_call_id", tool_name)
-            
-            # Get structured response if available
-            structured_response = msg.get("structured_response")
-            if structured_response is None:
-                try:
-                    structured_response = json.loads(content)
-                except Exception:
-                    structured_response = {"content": content}
-            
-            # Convert to string for ToolMessage
-            tool_content = json.dumps(structured_response) if isinstance(structured_response, dict) else str(structured_response)
-            
-            messages.append(ToolMessage(
-                content=tool_content,
-                tool_call_id=tool_call_id,
-                name=tool_name
-            ))
-    
+    messages: List[Any] = [SystemMessage(content=system_prompt)]
+
+    # Process history (last 40 messages); history may be a deque, which
+    # doesn't support slicing
+    recent = list(history or [])[-40:]
+    messages.extend(
+        lc_msg
+        for msg in recent
+        if (handler := _ROLE_HANDLERS.get(msg.get("role"))) is not None
+        and (lc_msg := handler(msg)) is not None
+    )
+
     # Add current query
     if query:
         messages.append(HumanMessage(content=query))
-    
+
     return messages
 
 
@@ -120,38 +230,55 @@ async def handle_master(state: AssistantState) -> AssistantState:
     
     The supervisor delegates tasks to appropriate sub-agents based on user queries.
     """
-    api_key = os.getenv("GEMINI_API_KEY")
-    model_name = os.getenv("GEMINI_MODEL")
-    
-    if not api_key:
+    if not _API_KEY:
         state["response"] = "Error: GEMINI_API_KEY is not set."
         return state
-    
+
     try:
-        # Create LangChain Gemini model with sub-agent tools
-        llm = ChatGoogleGenerativeAI(
-            model=model_name,
-            google_api_key=api_key,
-            temperature=0.7,
-            convert_system_message_to_human=True
-        )
-        
-        # Bind sub-agent tools to the supervisor
-        llm_with_tools = llm.bind_tools(SUB_AGENT_TOOLS)
-        
+        # Shared supervisor LLM with sub-agent tools bound
+        llm_with_tools = _get_llm_with_tools(_MODEL_NAME, _API_KEY)
+
         # Build initial messages from history and query
         query = state.get("query_to_be_served", "")
         history = state.get("history", [])
-        
+
         # Enhanced system prompt for supervisor
         supervisor_prompt = MASTER_AGENT_SYSTEM_PROMPT
-        
-        messages = _build_langchain_messages_from_history(
-            history,
-            query,
-            supervisor_prompt
-        )
-        
+
+        # Reuse the already-converted messages from prior turns when we have
+        # them: re-walking history every turn shifts the prompt bytes and
+        # defeats the provider's prefix cache. Rebuild only when the cache is
+        # cold, the history was cleared, or the transcript outgrew the cap.
+        prefix = state.get("_lc_messages_prefix") or []
+        if not prefix or not history or len(prefix) > _PREFIX_MAX_MESSAGES:
+            prefix = _build_langchain_messages_from_history(
+                history,
+                "",
+                supervisor_prompt
+            )
+        messages = list(prefix)
+        if query:
+            messages.append(HumanMessage(content=query))
+
+        on_token = state.get("_on_token")
+
+        async def _invoke_supervisor():
+            """One supervisor turn; streams chunks to on_token when set so
+            time-to-first-token stops tracking total generation time."""
+            if on_token is None:
+                return await llm_with_tools.ainvoke(messages)
+
+            response = None
+            async for chunk in llm_with_tools.astream(messages):
+                response = chunk if response is None else response + chunk
+                # Forward content only while no tool call has started; a
+                # delegating turn needs the full tool_calls before dispatch
+                if chunk.content and not getattr(response, "tool_call_chunks", None):
+                    maybe_awaitable = on_token(chunk.content)
+                    if inspect.isawaitable(maybe_awaitable):
+                        await maybe_awaitable
+            return response
+
         # Tool calling loop
         MAX_ITERATIONS = 20
         iterations = 0
@@ -160,28 +287,40 @@ async def handle_master(state: AssistantState) -> AssistantState:
             iterations += 1
             
             # Invoke the supervisor
-            response = await llm_with_tools.ainvoke(messages)
-            
+            response = await _invoke_supervisor()
+
             # Check if supervisor wants to delegate to sub-agents
-            if not response.tool_calls:
+            if response is None or not response.tool_calls:
                 # No delegation needed; return final response
-                final_text = response.content
-                if final_text:
-                    state["response"] = final_text
-                    return state
-                state["response"] = "I processed your request."
+                final_text = response.content if response is not None else ""
+                state["response"] = final_text if final_text else "I processed your request."
+                # Persist this turn's transcript so the next turn extends it
+                # instead of re-converting history
+                state["_lc_messages_prefix"] = messages + (
+                    [response] if response is not None else [AIMessage(content=state["response"])]
+                )
                 return state
             
             # Add AI message with tool calls to conversation
             messages.append(response)
             
-            # Execute each sub-agent tool call
-            for tool_call in response.tool_calls:
+            # Execute independent sub-agent calls concurrently; a turn that
+            # delegates to N agents costs max instead of sum of latencies
+            results = await asyncio.gather(
+                *[_execute_tool_call(tool_call) for tool_call in response.tool_calls]
+            )
+
+            # Record each delegation together with its result, in the
+            # original tool_call order. History must stay interleaved
+            # (delegation, result, delegation, result): the rebuild path
+            # emits one single-tool-call AIMessage per entry, and the
+            # provider rejects a transcript where a function response does
+            # not directly follow its function call.
+            for tool_call, result_content in zip(response.tool_calls, results):
                 tool_name = tool_call.get("name", "")
                 tool_args = tool_call.get("args", {})
                 tool_call_id = tool_call.get("id", tool_name)
-                
-                # Store supervisor's delegation in history
+
                 state = push_history(
                     state,
                     "assistant",
@@ -191,26 +330,7 @@ async def handle_master(state: AssistantState) -> AssistantState:
                 if state["history"]:
                     state["history"][-1]["function_call"] = {"name": tool_name, "args": tool_args}  # type: ignore
                     state["history"][-1]["tool_call_id"] = tool_call_id  # type: ignore
-                
-                # Execute sub-agent tool
-                try:
-                    # Find and execute the tool
-                    tool_func = None
-                    for tool in SUB_AGENT_TOOLS:
-                        if tool.name == tool_name:
-                            tool_func = tool
-                            break
-                    
-                    if tool_func:
-                        # Execute the sub-agent
-                        result = await tool_func.ainvoke(tool_args)
-                        result_content = result if isinstance(result, str) else json.dumps(result)
-                    else:
-                        result_content = json.dumps({"error": f"Unknown tool: {tool_name}"})
-                except Exception as e:
-                    result_content = json.dumps({"error": str(e)})
-                    print(f"Error calling sub-agent {tool_name}: {e}")
-                
+
                 # Create ToolMessage for the supervisor
                 tool_message = ToolMessage(
                     content=result_content,
@@ -218,8 +338,9 @@ async def handle_master(state: AssistantState) -> AssistantState:
                     name=tool_name
                 )
                 messages.append(tool_message)
-                
-                # Store sub-agent result in history
+
+                # Store sub-agent result in history; the content string is
+                # the canonical form, so no parse-back is needed
                 state = push_history(
                     state,
                     "tool",
@@ -227,18 +348,16 @@ async def handle_master(state: AssistantState) -> AssistantState:
                     name=tool_name
                 )
                 if state["history"]:
-                    try:
-                        state["history"][-1]["structured_response"] = json.loads(result_content)  # type: ignore
-                    except Exception:
-                        state["history"][-1]["structured_response"] = {"content": result_content}  # type: ignore
                     state["history"][-1]["tool_call_id"] = tool_call_id  # type: ignore
         
         # Max iterations reached
         state["response"] = "I processed your request but reached the iteration limit."
+        state["_lc_messages_prefix"] = messages + [AIMessage(content=state["response"])]
         return state
-        
+
     except Exception as e:
         state["response"] = f"Error: {str(e)}"
-        import traceback
-        traceback.print_exc()
+        # Force a rebuild from history next turn
+        state["_lc_messages_prefix"] = []
+        logger.exception("handle_master failed")
         return state
@@ -0,0 +1,68 @@
+"""
+Long-lived MCP client connections shared across sub-agent invocations.
+
+Each sub-agent used to construct a fresh MCPClient and pay the TCP +
+MCP handshake on every query. Keep one connected client per MCP URL for
+the lifetime of the process instead, and close them all on shutdown.
+"""
+import asyncio
+from typing import Dict, Optional
+
+import httpx
+from fastmcp import Client as MCPClient
+
+_CLIENTS: Dict[str, MCPClient] = {}
+_INIT_LOCK = asyncio.Lock()
+
+# Connection pool shared by every MCP transport so parallel tool calls
+# multiplex over warm keep-alive connections instead of opening one each
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+
+def _httpx_client_factory(
+    headers: Optional[dict] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """Build the transport's httpx client with our pooling limits applied."""
+    return httpx.AsyncClient(headers=headers, timeout=timeout, auth=auth, limits=_HTTP_LIMITS)
+
+
+def _make_client(url: str) -> MCPClient:
+    """Construct an MCP client, injecting the pooled HTTP transport when the
+    installed fastmcp exposes it; otherwise fall back to the default."""
+    try:
+        from fastmcp.client.transports import StreamableHttpTransport
+        transport = StreamableHttpTransport(url, httpx_client_factory=_httpx_client_factory)
+        return MCPClient(transport)
+    except Exception:
+        return MCPClient(url)
+
+
+async def get_client(url: str) -> MCPClient:
+    """Return a connected MCP client for the given URL, opening it on first use."""
+    client = _CLIENTS.get(url)
+    if client is not None:
+        return client
+
+    async with _INIT_LOCK:
+        # Another coroutine may have connected while we waited on the lock
+        client = _CLIENTS.get(url)
+        if client is not None:
+            return client
+
+        client = _make_client(url)
+        await client.__aenter__()
+        _CLIENTS[url] = client
+        return client
+
+
+async def close_clients() -> None:
+    """Close all open MCP connections. Call on application shutdown."""
+    async with _INIT_LOCK:
+        for url, client in list(_CLIENTS.items()):
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception:
+                pass
+            _CLIENTS.pop(url, None)
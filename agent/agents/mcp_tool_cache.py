@@ -0,0 +1,87 @@
+"""
+Process-wide cache for MCP tool discovery.
+
+Tool schemas rarely change, yet every sub-agent invocation used to call
+list_tools() and re-convert the schemas to LangChain format. Cache both
+the raw tool list and the converted specs per MCP URL with a TTL so the
+round-trip and conversion run once per process in steady state.
+"""
+import time
+from typing import Any, Dict, List, Tuple
+
+# url -> (fetched_at, raw_tools, langchain_tools)
+_TOOL_CACHE: Dict[str, Tuple[float, List[Any], List[Dict[str, Any]]]] = {}
+
+# How long a cached tool list stays fresh (seconds)
+TOOL_CACHE_TTL = 300.0
+
+
+def _to_plain(obj: Any) -> Any:
+    """Coerce a schema object to plain JSON-compatible types without a
+    serialize/parse round-trip."""
+    if isinstance(obj, dict):
+        return {key: _to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(item) for item in obj]
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    return str(obj)
+
+
+def convert_mcp_tools_to_langchain(tools: List[Any]) -> List[Dict[str, Any]]:
+    """Convert MCP tool specs to LangChain tool format."""
+    langchain_tools = []
+
+    for tool in tools:
+        # Get tool attributes
+        desc = getattr(tool, "description", "") or getattr(tool, "title", "")
+        input_schema = getattr(tool, "inputSchema", {}) or {}
+
+        # Convert to plain dict
+        if not isinstance(input_schema, dict):
+            try:
+                input_schema = _to_plain(input_schema)
+                if not isinstance(input_schema, dict):
+                    input_schema = {"type": "object", "properties": {}, "required": []}
+            except Exception:
+                input_schema = {"type": "object", "properties": {}, "required": []}
+
+        # Ensure type is present
+        if "type" not in input_schema:
+            input_schema["type"] = "object"
+
+        tool_def = {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": desc,
+                "parameters": input_schema,
+            }
+        }
+        langchain_tools.append(tool_def)
+
+    return langchain_tools
+
+
+async def get_tools(client: Any, url: str) -> Tuple[List[Any], List[Dict[str, Any]]]:
+    """
+    Return (raw_tools, langchain_tools) for an MCP server, served from the
+    cache when fresh, otherwise refreshed via the given connected client.
+    """
+    cached = _TOOL_CACHE.get(url)
+    now = time.monotonic()
+    if cached and now - cached[0] < TOOL_CACHE_TTL:
+        return cached[1], cached[2]
+
+    tools = await client.list_tools()
+    langchain_tools = convert_mcp_tools_to_langchain(tools)
+    _TOOL_CACHE[url] = (now, tools, langchain_tools)
+    return tools, langchain_tools
+
+
+def invalidate_tool_cache(url: str = None) -> None:
+    """Drop the cached tools for one MCP URL, or all of them."""
+    if url is None:
+        _TOOL_CACHE.clear()
+    else:
+        _TOOL_CACHE.pop(url, None)
@@ -1,3 +1,8 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 from agent.states.assistant_state import AssistantState, Message
 
@@ -5,10 +10,23 @@ from agent.clients.ollama_client import generate_json
 from agent.constants import DEFAULT_ROUTER_MODEL
 from dotenv import load_dotenv
 from agent.prompts.query_rewriter_prompts.prompt import QUERY_REWRITER_SYSTEM_PROMPT
-from agent.eval_queue import publish_eval_event
+from agent.eval_queue import publish_eval_event_nowait
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Rewrites depend on recent history, so key the cache on query + the last
+# few history lines; TTL keeps stale rewrites from outliving the session
+_REWRITE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_REWRITE_CACHE_MAX = 512
+_REWRITE_CACHE_TTL = 300.0
+_REWRITE_CACHE_LOCK = threading.Lock()
+
+
+def _rewrite_cache_key(user_query: str, history_texts: Sequence[str]) -> str:
+    payload = user_query + "\n".join(history_texts[-5:])
+    return hashlib.blake2b(payload.encode()).hexdigest()
 
 
 def _normalize_history(messages: Optional[Iterable[str]]) -> List[str]:
@@ -34,9 +52,7 @@ def build_rewrite_prompt(user_query: str, messages: Optional[Iterable[str]] = No
         + user_query.strip()
         + "\nRespond with: {\"rewritten_query\": \"<standalone_query>\"}"
     )
-    print('--------------------------------')
-    print(prompt)
-    print('--------------------------------')
+    logger.debug("rewrite prompt: %s", prompt)
     return prompt
 
 
@@ -45,36 +61,59 @@ def rewrite_query(
     messages: Optional[Iterable[str]] = None,
     model: str = DEFAULT_ROUTER_MODEL,
 ) -> str:
-    prompt = build_rewrite_prompt(user_query=user_query, messages=messages)
+    history_texts = _normalize_history(messages)
+    cache_key = _rewrite_cache_key(user_query, history_texts)
+    now = time.monotonic()
+
+    with _REWRITE_CACHE_LOCK:
+        cached = _REWRITE_CACHE.get(cache_key)
+        if cached and now - cached[0] < _REWRITE_CACHE_TTL:
+            _REWRITE_CACHE.move_to_end(cache_key)
+            return cached[1]
+
+    prompt = build_rewrite_prompt(user_query=user_query, messages=history_texts)
     result: Dict[str, Any] | None = generate_json(model=model, prompt=prompt)
+    rewritten_query = user_query.strip()
     if isinstance(result, dict):
         rewritten = result.get("rewritten_query")
         if isinstance(rewritten, str) and rewritten.strip():
-            return rewritten.strip()
+            rewritten_query = rewritten.strip()
     # Fallback to original query if model did not return parseable JSON
-    return user_query.strip()
+
+    with _REWRITE_CACHE_LOCK:
+        _REWRITE_CACHE[cache_key] = (now, rewritten_query)
+        _REWRITE_CACHE.move_to_end(cache_key)
+        while len(_REWRITE_CACHE) > _REWRITE_CACHE_MAX:
+            _REWRITE_CACHE.popitem(last=False)
+
+    return rewritten_query
 
 
-def rewrite_node(state: AssistantState) -> AssistantState:
+async def rewrite_node(state: AssistantState) -> AssistantState:
     """
     LangGraph node: rewrite state's query using optional history.
+
+    Runs the blocking Ollama call in a worker thread so concurrent requests
+    keep making progress on the event loop.
     """
+    import asyncio
     import time
-    start_time = time.time()
-    
+    start_time = time.perf_counter()
+
     history: List[Message] = state.get("history", []) or []  # type: ignore[assignment]
     history_texts = [m.get("content", "") for m in history if m.get("content")]
-    
+
     original_query = state.get("query_to_be_served", "") or ""
-    rewritten = rewrite_query(
-        user_query=original_query,
-        messages=history_texts,
+    rewritten = await asyncio.to_thread(
+        rewrite_query,
+        original_query,
+        history_texts,
     )
+
+    execution_time = (time.perf_counter() - start_time) * 1000
     
-    execution_time = (time.time() - start_time) * 1000
-    
-    # Publish eval event (async, non-blocking)
-    publish_eval_event(
+    # Publish eval event without blocking the node
+    publish_eval_event_nowait(
         agent_name="query_rewriter",
         query=f"Original: {original_query}",
         response=f"Rewritten: {rewritten}",
@@ -89,7 +128,5 @@ def rewrite_node(state: AssistantState) -> AssistantState:
     )
     
     state["query_to_be_served"] = rewritten
-    print('--------------------------------')
-    print(rewritten)
-    print('--------------------------------')
+    logger.debug("rewritten query: %s", rewritten)
     return state
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Fused query-rewrite + routing node.
+
+The pipeline used to make two sequential Ollama calls per turn — rewrite
+then route — paying two network round-trips and two prefill passes over
+largely shared context. One call that returns both keys halves that cost.
+The original two-step path is kept as a fallback when the fused response
+does not parse.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+
+from agent.states.assistant_state import AssistantState, Message
+from agent.constants import CATEGORIES, DEFAULT_ROUTER_MODEL
+from agent.clients.ollama_client import generate_json
+from agent.eval_queue import publish_eval_event_nowait
+from agent.agents.query_rewriter import (
+    _format_history_for_prompt,
+    _normalize_history,
+    _rewrite_cache_key,
+    rewrite_query,
+)
+from agent.agents.router_agent import route_category
+from agent.agents.router_fast import _fast_route
+
+
+REWRITE_AND_ROUTE_SYSTEM_PROMPT = (
+    """You are the query preprocessor for a personal assistant. In ONE response you must do two things:
+
+1. REWRITE: Transform the user's latest message into a clear, standalone query that can be understood without the chat history. Resolve pronouns, time references, and implicit references using the history. Preserve ALL entities (names, dates, times, amounts) and the user's intent. Do not invent information.
+
+2. ROUTE: Classify the rewritten query into exactly one category from the list.
+
+Categories: """ + ", ".join(CATEGORIES) + """
+Routing rules:
+- Match the request strictly to the available categories only.
+- If the request matches no category, use 'none'.
+
+You MUST respond with ONLY this JSON structure, nothing else:
+{"rewritten_query": "<standalone_query>", "category": "<one_of_categories>"}
+"""
+)
+
+
+# Fused results are cached like rewrites (same key: query + recent
+# history, see query_rewriter); repeats of one turn skip the model call
+_RR_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_RR_CACHE_MAX = 512
+_RR_CACHE_TTL = 300.0
+_RR_CACHE_LOCK = threading.Lock()
+
+
+def rewrite_and_route(
+    user_query: str,
+    history_texts: Sequence[str],
+    model: str = DEFAULT_ROUTER_MODEL,
+) -> Tuple[str, str]:
+    """
+    Rewrite the query and classify it in one model call.
+
+    Returns:
+        (rewritten_query, category); falls back to the separate
+        rewrite_query + route_category path if the fused response is
+        malformed.
+    """
+    history = _normalize_history(history_texts)
+
+    # Keyword fast path: with no history there is nothing for the rewrite
+    # to resolve, so an unambiguous keyword match answers both halves
+    # without any model call
+    if not history:
+        fast_category = _fast_route(user_query)
+        if fast_category is not None:
+            return user_query.strip(), fast_category
+
+    cache_key = _rewrite_cache_key(user_query, history)
+    now = time.monotonic()
+    with _RR_CACHE_LOCK:
+        cached = _RR_CACHE.get(cache_key)
+        if cached and now - cached[0] < _RR_CACHE_TTL:
+            _RR_CACHE.move_to_end(cache_key)
+            return cached[1]
+
+    history_block = _format_history_for_prompt(history)
+    prompt = (
+        REWRITE_AND_ROUTE_SYSTEM_PROMPT
+        + "\n\nChat history (most recent last):\n"
+        + history_block
+        + "\n\nUser: "
+        + user_query.strip()
+    )
+
+    result = generate_json(model=model, prompt=prompt)
+    fused = None
+    if isinstance(result, dict):
+        rewritten = result.get("rewritten_query")
+        category = result.get("category")
+        if isinstance(rewritten, str) and rewritten.strip() and isinstance(category, str) and category.strip():
+            fused = (rewritten.strip(), category.strip())
+
+    if fused is None:
+        # Fallback: the original two sequential calls
+        rewritten = rewrite_query(user_query=user_query, messages=history)
+        fused = (rewritten, route_category(rewritten))
+
+    with _RR_CACHE_LOCK:
+        _RR_CACHE[cache_key] = (now, fused)
+        _RR_CACHE.move_to_end(cache_key)
+        while len(_RR_CACHE) > _RR_CACHE_MAX:
+            _RR_CACHE.popitem(last=False)
+
+    return fused
+
+
+async def rewrite_and_route_node(state: AssistantState) -> AssistantState:
+    """
+    LangGraph node: set both query_to_be_served and category_to_be_served
+    from a single preprocessing call.
+    """
+    start_time = time.perf_counter()
+
+    history: List[Message] = state.get("history", []) or []  # type: ignore[assignment]
+    history_texts = [m.get("content", "") for m in history if m.get("content")]
+
+    original_query = state.get("query_to_be_served", "") or ""
+    rewritten, category = await asyncio.to_thread(
+        rewrite_and_route,
+        original_query,
+        history_texts,
+    )
+
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    # Publish eval event without blocking the node
+    publish_eval_event_nowait(
+        agent_name="rewrite_and_route",
+        query=f"Original: {original_query}",
+        response=f"Rewritten: {rewritten} | Category: {category}",
+        category="router",
+        metadata={
+            "execution_time_ms": execution_time,
+            "original_query": original_query,
+            "rewritten_query": rewritten,
+            "routed_category": category,
+            "available_categories": CATEGORIES
+        }
+    )
+
+    state["query_to_be_served"] = rewritten
+    state["category_to_be_served"] = category
+    return state
@@ -1,9 +1,11 @@
+from functools import lru_cache
 from typing import Dict, Optional
 
 from agent.states.assistant_state import AssistantState
 from agent.constants import CATEGORIES, DEFAULT_ROUTER_MODEL
 from agent.clients.ollama_client import generate_json
-from agent.eval_queue import publish_eval_event
+from agent.agents.router_fast import _fast_route
+from agent.eval_queue import publish_eval_event_nowait
 
 
 ROUTER_SYSTEM_PROMPT = (
@@ -20,38 +22,55 @@ ROUTER_SYSTEM_PROMPT = (
 )
 
 
-def route_category(user_query: str) -> str:
-    prompt = (
-        ROUTER_SYSTEM_PROMPT
-        + "User: "
-        + user_query.strip()
-        + "\nRespond with: {\"category\": \"<one_of_categories>\"}"
-    )
+# Assembled once; route_category only interpolates the query between them
+_PROMPT_PREFIX = ROUTER_SYSTEM_PROMPT + "User: "
+_PROMPT_SUFFIX = "\nRespond with: {\"category\": \"<one_of_categories>\"}"
+
+
+@lru_cache(maxsize=1024)
+def _route_cached(user_query_normalized: str) -> str:
+    """Classify one normalized query; repeats of the same phrasing hit the
+    cache instead of paying another model round-trip."""
+    prompt = f"{_PROMPT_PREFIX}{user_query_normalized}{_PROMPT_SUFFIX}"
     result: Optional[Dict] = generate_json(model=DEFAULT_ROUTER_MODEL, prompt=prompt)
     if result and "category" in result:
         return result["category"]
     return "none"
 
 
+def route_category(user_query: str) -> str:
+    return _route_cached(user_query.strip().lower())
+
+
 def get_assistant_state(user_query: str) -> AssistantState:
     category = route_category(user_query)
     return AssistantState(category_to_be_served=category)
  
  
-def router_node(state: AssistantState) -> AssistantState:
+async def router_node(state: AssistantState) -> AssistantState:
     """
     LangGraph node: classify state's current query and set category_to_be_served.
+
+    Runs the blocking Ollama call in a worker thread so concurrent requests
+    keep making progress on the event loop.
     """
+    import asyncio
     import time
-    start_time = time.time()
-    
+    start_time = time.perf_counter()
+
     query = state.get("query_to_be_served", "") or ""
-    category = route_category(query)
-    
-    execution_time = (time.time() - start_time) * 1000
+
+    # Keyword fast path: unambiguous queries route without a model call
+    # (and without leaving the event loop)
+    category = _fast_route(query)
+    fast_routed = category is not None
+    if category is None:
+        category = await asyncio.to_thread(route_category, query)
+
+    execution_time = (time.perf_counter() - start_time) * 1000
     
-    # Publish eval event (async, non-blocking)
-    publish_eval_event(
+    # Publish eval event without blocking the node
+    publish_eval_event_nowait(
         agent_name="router_agent",
         query=f"Query: {query}",
         response=f"Category: {category}",
@@ -59,6 +78,7 @@ def router_node(state: AssistantState) -> AssistantState:
         metadata={
             "execution_time_ms": execution_time,
             "routed_category": category,
+            "fast_routed": fast_routed,
             "available_categories": CATEGORIES
         }
     )
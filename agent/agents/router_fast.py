@@ -0,0 +1,56 @@
+"""
+Keyword fast-path for routing.
+
+Many queries ("send an email", "schedule a meeting", "add an expense") are
+trivially classifiable without a model call. One pass of a precompiled
+regex routes those in microseconds; anything ambiguous — no match, or
+matches in more than one category — is left to the LLM router.
+"""
+import re
+from typing import Optional
+
+# Keyword vocabulary per routable category. Keep these high-precision:
+# a wrong fast-route is worse than falling back to the LLM.
+_KEYWORDS = {
+    "mail": [
+        "email", "emails", "e-mail", "mail", "inbox", "gmail",
+        "unread", "attachment", "attachments",
+    ],
+    "calendar": [
+        "calendar", "meeting", "meetings", "event", "events",
+        "schedule", "reschedule", "appointment", "appointments", "invite",
+    ],
+    "expense_tracker": [
+        "expense", "expenses", "spent", "spending", "budget",
+        "cost", "costs", "paid", "purchase", "purchases",
+    ],
+}
+
+# One alternation with a named group per category so a single scan tells
+# us which categories matched
+_FAST_ROUTE_RE = re.compile(
+    "|".join(
+        f"(?P<{category}>\\b(?:{'|'.join(map(re.escape, words))})\\b)"
+        for category, words in _KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+
+def _fast_route(user_query: str) -> Optional[str]:
+    """
+    Classify a query by keyword, or return None when the LLM should decide.
+
+    Accepts the fast route only when exactly one category's keywords appear
+    anywhere in the query; overlapping matches (e.g. "email me the expense
+    report") are ambiguous and defer to the model.
+    """
+    matched = {
+        category
+        for match in _FAST_ROUTE_RE.finditer(user_query)
+        for category, hit in match.groupdict().items()
+        if hit is not None
+    }
+    if len(matched) == 1:
+        return matched.pop()
+    return None
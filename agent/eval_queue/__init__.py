@@ -1,8 +1,13 @@
 """
 Event-driven evaluation queue system using Redis
 """
-from .publisher import publish_eval_event
+from .publisher import publish_eval_event, publish_eval_event_background, publish_eval_event_nowait
 from .consumer import start_eval_consumer
 
-__all__ = ["publish_eval_event", "start_eval_consumer"]
+__all__ = [
+    "publish_eval_event",
+    "publish_eval_event_background",
+    "publish_eval_event_nowait",
+    "start_eval_consumer",
+]
 
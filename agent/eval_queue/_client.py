@@ -0,0 +1,41 @@
+"""
+Shared Redis connection pools for the eval queue.
+
+Publisher and consumer used to build their own redis.Redis with default
+pool settings: unbounded connections and no TCP keepalive, so idle
+sockets could be dropped by NAT and stall the next command. Both sides
+now draw from explicitly sized, keepalive-enabled pools defined here
+(one sync, one asyncio — the two client families cannot share a pool).
+"""
+import socket
+
+import redis
+import redis.asyncio as aioredis
+
+from .config import REDIS_HOST, REDIS_PORT, REDIS_DB, REDIS_PASSWORD
+
+# Keepalive tuning; the constants are Linux-specific, so take what the
+# platform offers
+_KEEPALIVE_OPTS = {}
+for _name, _value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3)):
+    _opt = getattr(socket, _name, None)
+    if _opt is not None:
+        _KEEPALIVE_OPTS[_opt] = _value
+
+_POOL_KWARGS = dict(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=REDIS_DB,
+    password=REDIS_PASSWORD,
+    max_connections=32,
+    socket_keepalive=True,
+    socket_keepalive_options=_KEEPALIVE_OPTS,
+    health_check_interval=30,
+    decode_responses=True,
+)
+
+_POOL = redis.ConnectionPool(**_POOL_KWARGS)
+redis_client = redis.Redis(connection_pool=_POOL)
+
+_ASYNC_POOL = aioredis.ConnectionPool(**_POOL_KWARGS)
+async_redis_client = aioredis.Redis(connection_pool=_ASYNC_POOL)
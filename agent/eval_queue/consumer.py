@@ -1,31 +1,76 @@
 """
 Event consumer - Listens to Redis queue and evaluates agent responses
 """
-import redis
 import json
 import asyncio
 import httpx
+import os
 import time
+import traceback
 from typing import Dict, Any
 
-from .config import (
-    REDIS_HOST, REDIS_PORT, REDIS_DB, REDIS_PASSWORD,
-    EVAL_QUEUE_NAME, EVAL_SERVER_URL
-)
+from .config import EVAL_QUEUE_NAME, EVAL_SERVER_URL
+from ._client import async_redis_client as redis_client
 from .gemini_evaluator import GeminiEvaluator
 
+# Evaluator built on first use; constructing it pulls in the Gemini client
+# stack, which importers of this module (via the package __init__) never need
+evaluator = None
+
+
+def _get_evaluator() -> GeminiEvaluator:
+    global evaluator
+    if evaluator is None:
+        evaluator = GeminiEvaluator()
+    return evaluator
 
-# Create Redis client
-redis_client = redis.Redis(
-    host=REDIS_HOST,
-    port=REDIS_PORT,
-    db=REDIS_DB,
-    password=REDIS_PASSWORD,
-    decode_responses=True
+# One pooled client for all eval-server POSTs; a per-event AsyncClient paid
+# a TCP handshake per evaluation. (http2 left off: it needs the optional h2
+# package and the eval server is local HTTP/1.1 anyway.)
+_EVAL_HTTP = httpx.AsyncClient(
+    base_url=EVAL_SERVER_URL,
+    timeout=httpx.Timeout(30.0, connect=3.0),
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
 )
 
-# Create evaluator
-evaluator = GeminiEvaluator()
+# Micro-batcher: finished evaluations queue here and a background flusher
+# coalesces up to _BATCH_MAX results (or whatever arrives within
+# _BATCH_WAIT_S of the first) into one POST /evals/batch
+_BATCH_MAX = 32
+_BATCH_WAIT_S = 0.25
+_pending: asyncio.Queue = asyncio.Queue()
+
+# Cap concurrent Gemini evaluations; the pop loop fans events out as tasks
+# and this keeps a deep backlog from turning into unbounded parallel calls
+_EVAL_SEM = asyncio.Semaphore(int(os.getenv("EVAL_CONCURRENCY", "8")))
+
+
+async def _wrapped_process(event: Dict[str, Any]) -> None:
+    async with _EVAL_SEM:
+        await process_eval_event(event)
+
+
+async def _flush_pending() -> None:
+    """Drain finished evaluations into batched eval-server POSTs."""
+    while True:
+        buf = [await _pending.get()]
+        try:
+            while len(buf) < _BATCH_MAX:
+                buf.append(await asyncio.wait_for(_pending.get(), timeout=_BATCH_WAIT_S))
+        except asyncio.TimeoutError:
+            pass
+
+        try:
+            server_response = await _EVAL_HTTP.post("/evals/batch", json={"items": buf})
+            if server_response.status_code == 200:
+                print(f"💾 Stored {len(buf)} eval result(s)")
+            else:
+                print(f"⚠️  Failed to store eval batch: {server_response.status_code}")
+                print(f"   Response: {server_response.text}")
+        except httpx.TimeoutException:
+            print(f"⚠️  Timeout storing eval batch of {len(buf)}")
+        except httpx.HTTPError as e:
+            print(f"⚠️  HTTP error storing eval batch: {e}")
 
 
 async def process_eval_event(event: Dict[str, Any]) -> None:
@@ -44,16 +89,16 @@ async def process_eval_event(event: Dict[str, Any]) -> None:
         
         print(f"📊 Evaluating: {agent_name} - {category}")
         
-        # Get evaluation from Gemini
-        start_time = time.time()
-        evaluation = await evaluator.evaluate(
+        # Get evaluation from Gemini (monotonic clock; wall time can jump)
+        t0 = time.perf_counter_ns()
+        evaluation = await _get_evaluator().evaluate(
             query=query,
             response=response,
             agent_name=agent_name,
             category=category,
             metadata=metadata
         )
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (time.perf_counter_ns() - t0) // 1_000_000
         
         # Ensure query and response are strings
         query_str = str(query) if not isinstance(query, str) else query
@@ -77,28 +122,14 @@ async def process_eval_event(event: Dict[str, Any]) -> None:
             }
         }
         
-        # Send to eval server
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                server_response = await client.post(
-                    f"{EVAL_SERVER_URL}/evals",
-                    json=eval_result
-                )
-                
-                if server_response.status_code == 200:
-                    status_emoji = "✅" if evaluation["status"] == "pass" else "❌"
-                    print(f"{status_emoji} Evaluated & Stored: {agent_name} - {evaluation['status']}")
-                else:
-                    print(f"⚠️  Failed to store eval result: {server_response.status_code}")
-                    print(f"   Response: {server_response.text}")
-            except httpx.TimeoutException:
-                print(f"⚠️  Timeout storing eval result for {agent_name}")
-            except httpx.HTTPError as e:
-                print(f"⚠️  HTTP error storing eval result: {e}")
+        # Queue for the micro-batcher; the flusher posts it with whatever
+        # else finishes within the batch window
+        _pending.put_nowait(eval_result)
+        status_emoji = "✅" if evaluation["status"] == "pass" else "❌"
+        print(f"{status_emoji} Evaluated: {agent_name} - {evaluation['status']}")
     
     except Exception as e:
         print(f"❌ Error processing eval event: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -109,28 +140,37 @@ async def consume_eval_queue():
     print(f"🎧 Eval consumer started - listening to '{EVAL_QUEUE_NAME}'")
     print(f"📡 Eval server: {EVAL_SERVER_URL}")
     
-    while True:
-        try:
-            # Block and wait for event (with 1 second timeout)
-            result = redis_client.blpop(EVAL_QUEUE_NAME, timeout=1)
-            
-            if result:
-                _, event_data = result
-                event = json.loads(event_data)
-                
-                # Process event asynchronously
-                await process_eval_event(event)
-            
-            # Small delay to prevent CPU spinning
-            await asyncio.sleep(0.1)
-        
-        except KeyboardInterrupt:
-            print("\n👋 Stopping eval consumer...")
-            break
-        
-        except Exception as e:
-            print(f"❌ Consumer error: {e}")
-            await asyncio.sleep(1)  # Wait before retrying
+    flusher = asyncio.create_task(_flush_pending())
+    # Strong references to in-flight evaluations; done tasks remove
+    # themselves so the set stays bounded by _EVAL_SEM's backlog
+    tasks: set = set()
+    try:
+        while True:
+            try:
+                # Long block on the async client; the loop stays free to run
+                # in-flight evaluations while we wait
+                result = await redis_client.blpop(EVAL_QUEUE_NAME, timeout=30)
+
+                if result:
+                    _, event_data = result
+                    event = json.loads(event_data)
+
+                    # Dispatch without awaiting so the next pop isn't gated on
+                    # this event's Gemini + eval-server round trips
+                    task = asyncio.create_task(_wrapped_process(event))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+            except KeyboardInterrupt:
+                print("\n👋 Stopping eval consumer...")
+                break
+
+            except Exception as e:
+                print(f"❌ Consumer error: {e}")
+                await asyncio.sleep(1)  # Wait before retrying
+    finally:
+        flusher.cancel()
+        await _EVAL_HTTP.aclose()
 
 
 def start_eval_consumer():
@@ -5,7 +5,12 @@ import functools
 import time
 from typing import Any, Callable
 
-from .publisher import publish_eval_event
+from .publisher import publish_eval_event_background, publish_eval_event_nowait
+
+
+def _s(value: Any) -> str:
+    """Stringify only when needed; agent paths almost always pass str."""
+    return value if type(value) is str else str(value)
 
 
 def auto_eval(agent_name: str, category: str):
@@ -25,16 +30,19 @@ def auto_eval(agent_name: str, category: str):
             query = args[0] if args else kwargs.get("query", "")
             
             # Execute function
-            start_time = time.time()
+            # Monotonic integer clock: immune to NTP jumps and cheaper
+            # than float wall-clock math
+            t0 = time.perf_counter_ns()
             result = await func(*args, **kwargs)
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - t0) // 1_000_000
             
-            # Publish eval event (non-blocking)
+            # Publish eval event (non-blocking; queued onto the loop's
+            # background drain task, never a sync Redis call here)
             try:
-                publish_eval_event(
+                publish_eval_event_nowait(
                     agent_name=agent_name,
-                    query=str(query),
-                    response=str(result),
+                    query=_s(query),
+                    response=_s(result),
                     category=category,
                     metadata={
                         "execution_time_ms": execution_time,
@@ -50,15 +58,17 @@ def auto_eval(agent_name: str, category: str):
         def sync_wrapper(*args, **kwargs) -> Any:
             query = args[0] if args else kwargs.get("query", "")
             
-            start_time = time.time()
+            t0 = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - t0) // 1_000_000
             
+            # Hand off to the daemon publisher thread; the Redis round
+            # trip stays off the caller's latency
             try:
-                publish_eval_event(
+                publish_eval_event_background(
                     agent_name=agent_name,
-                    query=str(query),
-                    response=str(result),
+                    query=_s(query),
+                    response=_s(result),
                     category=category,
                     metadata={
                         "execution_time_ms": execution_time,
@@ -67,9 +77,9 @@ def auto_eval(agent_name: str, category: str):
                 )
             except Exception as e:
                 print(f"⚠️  Failed to publish eval: {e}")
-            
+
             return result
-        
+
         # Return appropriate wrapper based on function type
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
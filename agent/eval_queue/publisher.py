@@ -1,22 +1,44 @@
 """
 Event publisher - Agents use this to push eval events to Redis queue
 """
-import redis
-import json
-from typing import Dict, Any, Optional, Union
+import asyncio
+import logging
+import queue
+import threading
+import orjson
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
-from .config import REDIS_HOST, REDIS_PORT, REDIS_DB, REDIS_PASSWORD, EVAL_QUEUE_NAME
+from .config import EVAL_QUEUE_NAME
+from ._client import redis_client
 
+logger = logging.getLogger(__name__)
 
-# Create Redis client
-redis_client = redis.Redis(
-    host=REDIS_HOST,
-    port=REDIS_PORT,
-    db=REDIS_DB,
-    password=REDIS_PASSWORD,
-    decode_responses=True
-)
+
+def _build_event(
+    agent_name: str,
+    query: Union[str, Any],
+    response: Union[str, Any],
+    category: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Assemble the queue payload dict for one eval event."""
+    # Ensure response is a string (handle various types)
+    if not isinstance(response, str):
+        if isinstance(response, (dict, list)):
+            response = orjson.dumps(response, default=str).decode()
+        else:
+            response = str(response)
+
+    return {
+        "agent_name": agent_name,
+        # Ensure query is a string without re-allocating one that already is
+        "query": query if type(query) is str else str(query),
+        "response": response,
+        "category": category,
+        "metadata": metadata or {},
+        "timestamp": datetime.utcnow().isoformat(),
+    }
 
 
 def publish_eval_event(
@@ -28,45 +50,170 @@ def publish_eval_event(
 ) -> bool:
     """
     Publish an eval event to Redis queue for async evaluation
-    
+
     Args:
         agent_name: Name of the agent (mail_agent, calendar_agent, etc.)
         query: User query that was processed
         response: Agent's response
         category: Category of the task (mail, calendar, expense, etc.)
         metadata: Additional metadata (tools used, execution time, etc.)
-    
+
     Returns:
         bool: True if successfully published
     """
     try:
-        # Ensure response is a string (handle various types)
-        if not isinstance(response, str):
-            if isinstance(response, (dict, list)):
-                response = json.dumps(response)
-            else:
-                response = str(response)
-        
-        event = {
-            "agent_name": agent_name,
-            "query": str(query),  # Ensure query is also string
-            "response": response,
-            "category": category,
-            "metadata": metadata or {},
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        
-        # Push to Redis queue
-        redis_client.rpush(EVAL_QUEUE_NAME, json.dumps(event))
-        
+        event = _build_event(agent_name, query, response, category, metadata)
+
+        # Push to Redis queue; orjson encodes several times faster than
+        # stdlib json and the consumer's json.loads reads it unchanged
+        redis_client.rpush(EVAL_QUEUE_NAME, orjson.dumps(event, default=str))
+
         return True
-    
+
     except Exception as e:
         # Don't fail the main agent flow if eval publishing fails
         print(f"⚠️  Failed to publish eval event: {e}")
         return False
 
 
+def publish_eval_events(events: List[Dict[str, Any]]) -> bool:
+    """
+    Publish several already-built events in one Redis round trip.
+
+    Events come from _build_event; a non-transactional pipeline batches
+    the RPUSHes so N events cost one network round trip instead of N.
+    """
+    if not events:
+        return True
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.rpush(EVAL_QUEUE_NAME, orjson.dumps(event, default=str))
+            pipe.execute()
+        return True
+    except Exception as e:
+        print(f"⚠️  Failed to publish eval events: {e}")
+        return False
+
+
+# Thread-based hand-off for sync callers: events queue in-process and a
+# daemon thread pushes them to Redis in pipelined batches, so the Redis
+# round trip never lands on the caller's latency
+_BG_EVENTS: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10_000)
+_BG_THREAD: Optional[threading.Thread] = None
+_BG_LOCK = threading.Lock()
+_BG_BATCH_MAX = 64
+
+
+def _bg_worker() -> None:
+    while True:
+        events = [_BG_EVENTS.get()]
+        while len(events) < _BG_BATCH_MAX:
+            try:
+                events.append(_BG_EVENTS.get_nowait())
+            except queue.Empty:
+                break
+        publish_eval_events(events)
+
+
+def publish_eval_event_background(
+    agent_name: str,
+    query: Union[str, Any],
+    response: Union[str, Any],
+    category: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Queue an eval event for a daemon publisher thread and return at once.
+
+    The thread-based counterpart to publish_eval_event_nowait for code
+    running outside an event loop. When the buffer is full the oldest
+    event is dropped so fresh telemetry wins.
+    """
+    global _BG_THREAD
+    if _BG_THREAD is None:
+        with _BG_LOCK:
+            if _BG_THREAD is None:
+                thread = threading.Thread(target=_bg_worker, name="eval-publisher", daemon=True)
+                thread.start()
+                _BG_THREAD = thread
+
+    event = _build_event(agent_name, query, response, category, metadata)
+    try:
+        _BG_EVENTS.put_nowait(event)
+    except queue.Full:
+        try:
+            _BG_EVENTS.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            _BG_EVENTS.put_nowait(event)
+        except queue.Full:
+            pass
+
+
+# Bounded hand-off buffer so agents never wait on the Redis publish; a
+# single background task drains it. Created lazily on the running loop.
+_EVENT_QUEUE: Optional[asyncio.Queue] = None
+_DRAIN_TASK: Optional[asyncio.Task] = None
+_EVENT_QUEUE_MAX = 1024
+_DROPPED_EVENTS = 0
+
+
+async def _drain_events() -> None:
+    """Background task: move queued eval events into Redis."""
+    while True:
+        kwargs = await _EVENT_QUEUE.get()
+        try:
+            await asyncio.to_thread(publish_eval_event, **kwargs)
+        except Exception as e:
+            logger.warning("Failed to publish eval event: %s", e)
+        finally:
+            _EVENT_QUEUE.task_done()
+
+
+def publish_eval_event_nowait(
+    agent_name: str,
+    query: Union[str, Any],
+    response: Union[str, Any],
+    category: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Queue an eval event for background publishing and return immediately.
+
+    Telemetry must not add to user-visible response time: events go into a
+    bounded in-process queue and are pushed to Redis by a background task.
+    If the queue is full the event is dropped with a warning; outside an
+    event loop this falls back to the blocking publish.
+    """
+    global _EVENT_QUEUE, _DRAIN_TASK, _DROPPED_EVENTS
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop: hand off to the daemon publisher thread instead
+        # of blocking the caller on a Redis round trip
+        publish_eval_event_background(agent_name, query, response, category, metadata)
+        return
+
+    if _EVENT_QUEUE is None:
+        _EVENT_QUEUE = asyncio.Queue(maxsize=_EVENT_QUEUE_MAX)
+        _DRAIN_TASK = loop.create_task(_drain_events())
+
+    try:
+        _EVENT_QUEUE.put_nowait({
+            "agent_name": agent_name,
+            "query": query,
+            "response": response,
+            "category": category,
+            "metadata": metadata,
+        })
+    except asyncio.QueueFull:
+        _DROPPED_EVENTS += 1
+        logger.warning("Eval event queue full; %d events dropped so far", _DROPPED_EVENTS)
+
+
 def get_queue_length() -> int:
     """Get current queue length"""
     try:
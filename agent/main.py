@@ -1,4 +1,6 @@
 import asyncio
+import os
+import traceback
 from dotenv import load_dotenv
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Input, RichLog, Static
@@ -12,6 +14,85 @@ from agent.schema.init_assistant_graph import build_graph
 from agent.states.assistant_state import AssistantState
 from agent.agents.master import push_history
 
+# Warm up at import: env vars and graph wiring are ready before the UI
+# mounts, so the first query doesn't pay the cold-start cost. Set
+# AGENT_SKIP_BOOT to defer (tooling that imports this module without
+# running the app).
+load_dotenv()
+_GRAPH = build_graph() if "AGENT_SKIP_BOOT" not in os.environ else None
+
+# Full tracebacks are opt-in; walking and formatting frames on every
+# error is wasted work when MCP transports flap in normal runs
+_DEBUG = os.getenv("AGENT_DEBUG") == "1"
+
+
+# Static renderables built once at import; rebuilding these Panels re-parses
+# the same rich markup on every mount, /help, or clear
+_WELCOME_PANEL = Panel(
+    "[bold cyan]🤖 Personal Assistant Ready![/bold cyan]\n\n"
+    "[yellow]Available Tools:[/yellow] Mail, Calendar, Expense Tracker\n\n"
+    "[dim]Commands:[/dim]\n"
+    "  • [cyan]/clear[/cyan] - Clear conversation history\n"
+    "  • [cyan]/history[/cyan] - Show conversation history\n"
+    "  • [cyan]/state[/cyan] - Show current state\n"
+    "  • [cyan]/help[/cyan] - Show this help message\n"
+    "  • [cyan]Ctrl+C[/cyan] - Quit application",
+    title="Welcome",
+    border_style="green"
+)
+
+_HELP_PANEL = Panel(
+    "[bold cyan]Available Commands:[/bold cyan]\n\n"
+    "  • [cyan]/clear[/cyan] - Clear conversation history\n"
+    "  • [cyan]/history[/cyan] - Show recent conversation history\n"
+    "  • [cyan]/state[/cyan] - Show current application state\n"
+    "  • [cyan]/help[/cyan] - Show this help message\n\n"
+    "[bold cyan]Keyboard Shortcuts:[/bold cyan]\n\n"
+    "  • [cyan]Ctrl+C[/cyan] - Quit application\n"
+    "  • [cyan]Ctrl+L[/cyan] - Clear history\n"
+    "  • [cyan]Ctrl+H[/cyan] - Show history\n\n"
+    "[bold cyan]Available Tools:[/bold cyan]\n\n"
+    "  • [green]Mail Agent[/green] - Read, send, manage emails\n"
+    "  • [green]Calendar Agent[/green] - Schedule, list, manage events\n"
+    "  • [green]Expense Agent[/green] - Track expenses, generate reports",
+    title="Help",
+    border_style="blue"
+)
+
+_CLEARED_PANEL = Panel(
+    "[bold green]✅ History cleared![/bold green]",
+    border_style="green"
+)
+
+_NO_HISTORY_PANEL = Panel(
+    "[yellow]No conversation history yet.[/yellow]",
+    title="History",
+    border_style="yellow"
+)
+
+# Role -> line template for history rendering; one dict lookup per message
+# instead of an if/elif chain re-evaluated on every Ctrl+H
+_HISTORY_FMT = {
+    "user": "[green]{i}. 👤 You:[/green] {c}",
+    "assistant": "[blue]{i}. 🤖 Assistant:[/blue] {c}",
+    "model": "[blue]{i}. 🤖 Assistant:[/blue] {c}",
+    "tool": "[yellow]{i}. 🔧 {name}:[/yellow] {c}",
+}
+
+
+def _render_history(history) -> str:
+    """Render the last 10 history entries as rich markup lines."""
+    lines = []
+    for i, m in enumerate(list(history)[-10:], 1):  # history may be a deque
+        fmt = _HISTORY_FMT.get(m.get("role", "user"))
+        if fmt is not None:
+            lines.append(fmt.format(
+                i=i,
+                c=(m.get("content", "") or "")[:150],
+                name=m.get("name", "unknown"),
+            ))
+    return "\n".join(lines)
+
 
 class PersonalAssistantApp(App):
     """A Textual app for Personal Assistant."""
@@ -59,10 +140,9 @@ class PersonalAssistantApp(App):
     
     def __init__(self):
         super().__init__()
-        load_dotenv()
-        
+
         # Initialize graph and state
-        self.graph = build_graph()
+        self.graph = _GRAPH if _GRAPH is not None else build_graph()
         self.state: AssistantState = {
             "category_to_be_served": "",
             "query_to_be_served": "",
@@ -100,18 +180,7 @@ class PersonalAssistantApp(App):
     def on_mount(self) -> None:
         """Called when app starts."""
         chat = self.query_one("#chat-container", RichLog)
-        chat.write(Panel(
-            "[bold cyan]🤖 Personal Assistant Ready![/bold cyan]\n\n"
-            "[yellow]Available Tools:[/yellow] Mail, Calendar, Expense Tracker\n\n"
-            "[dim]Commands:[/dim]\n"
-            "  • [cyan]/clear[/cyan] - Clear conversation history\n"
-            "  • [cyan]/history[/cyan] - Show conversation history\n"
-            "  • [cyan]/state[/cyan] - Show current state\n"
-            "  • [cyan]/help[/cyan] - Show this help message\n"
-            "  • [cyan]Ctrl+C[/cyan] - Quit application",
-            title="Welcome",
-            border_style="green"
-        ))
+        chat.write(_WELCOME_PANEL)
         
         # Focus the input
         self.query_one("#user-input", Input).focus()
@@ -149,85 +218,59 @@ class PersonalAssistantApp(App):
         await self.process_query(user_input, chat)
     
     async def handle_command(self, command: str, chat: RichLog) -> None:
-        """Handle special commands."""
-        cmd = command.lower()
-        
-        if cmd == "/clear":
-            self.state["history"] = []
-            self.state["query_to_be_served"] = ""
-            self.state["category_to_be_served"] = ""
-            self.state["response"] = ""
-            chat.clear()
-            chat.write(Panel(
-                "[bold green]✅ History cleared successfully![/bold green]",
-                border_style="green"
-            ))
-        
-        elif cmd == "/history":
-            history = self.state.get("history", [])
-            if not history:
-                chat.write(Panel(
-                    "[yellow]No conversation history yet.[/yellow]",
-                    title="History",
-                    border_style="yellow"
-                ))
-            else:
-                history_text = ""
-                for i, m in enumerate(history[-10:], 1):  # Show last 10
-                    role = m.get('role', 'user')
-                    content = m.get('content', '')[:150]
-                    
-                    if role == "user":
-                        history_text += f"[green]{i}. 👤 You:[/green] {content}\n"
-                    elif role in ("assistant", "model"):
-                        history_text += f"[blue]{i}. 🤖 Assistant:[/blue] {content}\n"
-                    elif role == "tool":
-                        tool_name = m.get('name', 'unknown')
-                        history_text += f"[yellow]{i}. 🔧 {tool_name}:[/yellow] {content[:100]}...\n"
-                
-                chat.write(Panel(
-                    history_text or "[yellow]No history[/yellow]",
-                    title=f"Recent History (Last 10/{len(history)})",
-                    border_style="cyan"
-                ))
-        
-        elif cmd == "/state":
-            state_text = (
-                f"[cyan]Category:[/cyan] {self.state.get('category_to_be_served', 'None')}\n"
-                f"[cyan]Query:[/cyan] {self.state.get('query_to_be_served', 'None')}\n"
-                f"[cyan]History entries:[/cyan] {len(self.state.get('history', []))}\n"
-                f"[cyan]Processing:[/cyan] {self.processing}"
-            )
-            chat.write(Panel(
-                state_text,
-                title="Current State",
-                border_style="magenta"
-            ))
-        
-        elif cmd == "/help":
-            help_text = (
-                "[bold cyan]Available Commands:[/bold cyan]\n\n"
-                "  • [cyan]/clear[/cyan] - Clear conversation history\n"
-                "  • [cyan]/history[/cyan] - Show recent conversation history\n"
-                "  • [cyan]/state[/cyan] - Show current application state\n"
-                "  • [cyan]/help[/cyan] - Show this help message\n\n"
-                "[bold cyan]Keyboard Shortcuts:[/bold cyan]\n\n"
-                "  • [cyan]Ctrl+C[/cyan] - Quit application\n"
-                "  • [cyan]Ctrl+L[/cyan] - Clear history\n"
-                "  • [cyan]Ctrl+H[/cyan] - Show history\n\n"
-                "[bold cyan]Available Tools:[/bold cyan]\n\n"
-                "  • [green]Mail Agent[/green] - Read, send, manage emails\n"
-                "  • [green]Calendar Agent[/green] - Schedule, list, manage events\n"
-                "  • [green]Expense Agent[/green] - Track expenses, generate reports"
-            )
+        """Handle special commands via the _COMMANDS dispatch table."""
+        fn = self._COMMANDS.get(command.lower())
+        if fn is None:
+            chat.write(Text(f"❌ Unknown command: {command}", style="red"))
+            return
+        fn(self, chat)
+
+    def _cmd_clear(self, chat: RichLog) -> None:
+        self.state["history"] = []
+        self.state["query_to_be_served"] = ""
+        self.state["category_to_be_served"] = ""
+        self.state["response"] = ""
+        # Drop the cached LangChain transcript too; otherwise the next
+        # supervisor turn would replay the pre-clear conversation
+        self.state["_lc_messages_prefix"] = []
+        chat.clear()
+        chat.write(_CLEARED_PANEL)
+
+    def _cmd_history(self, chat: RichLog) -> None:
+        history = self.state.get("history", [])
+        if not history:
+            chat.write(_NO_HISTORY_PANEL)
+        else:
             chat.write(Panel(
-                help_text,
-                title="Help",
-                border_style="blue"
+                _render_history(history) or "[yellow]No history[/yellow]",
+                title=f"Recent History (Last 10/{len(history)})",
+                border_style="cyan"
             ))
-        
-        else:
-            chat.write(Text(f"❌ Unknown command: {command}", style="red"))
+
+    def _cmd_state(self, chat: RichLog) -> None:
+        state_text = (
+            f"[cyan]Category:[/cyan] {self.state.get('category_to_be_served', 'None')}\n"
+            f"[cyan]Query:[/cyan] {self.state.get('query_to_be_served', 'None')}\n"
+            f"[cyan]History entries:[/cyan] {len(self.state.get('history', []))}\n"
+            f"[cyan]Processing:[/cyan] {self.processing}"
+        )
+        chat.write(Panel(
+            state_text,
+            title="Current State",
+            border_style="magenta"
+        ))
+
+    def _cmd_help(self, chat: RichLog) -> None:
+        chat.write(_HELP_PANEL)
+
+    # Command -> handler; a hash lookup replaces the if/elif chain and new
+    # commands register here without touching handle_command
+    _COMMANDS = {
+        "/clear": _cmd_clear,
+        "/history": _cmd_history,
+        "/state": _cmd_state,
+        "/help": _cmd_help,
+    }
     
     async def process_query(self, user_input: str, chat: RichLog) -> None:
         """Process user query through the agent graph."""
@@ -276,52 +319,19 @@ class PersonalAssistantApp(App):
                 f"[bold red]❌ Error:[/bold red]\n{str(e)}",
                 border_style="red"
             ))
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                traceback.print_exc()
         
         finally:
             self.processing = False
     
     def action_clear(self) -> None:
         """Clear conversation history (Ctrl+L)."""
-        chat = self.query_one("#chat-container", RichLog)
-        self.state["history"] = []
-        self.state["query_to_be_served"] = ""
-        self.state["category_to_be_served"] = ""
-        self.state["response"] = ""
-        chat.clear()
-        chat.write(Panel(
-            "[bold green]✅ History cleared![/bold green]",
-            border_style="green"
-        ))
+        self._cmd_clear(self.query_one("#chat-container", RichLog))
     
     def action_show_history(self) -> None:
         """Show conversation history (Ctrl+H)."""
-        chat = self.query_one("#chat-container", RichLog)
-        history = self.state.get("history", [])
-        
-        if not history:
-            chat.write(Panel(
-                "[yellow]No conversation history yet.[/yellow]",
-                title="History",
-                border_style="yellow"
-            ))
-        else:
-            history_text = ""
-            for i, m in enumerate(history[-10:], 1):
-                role = m.get('role', 'user')
-                content = m.get('content', '')[:150]
-                
-                if role == "user":
-                    history_text += f"[green]{i}. 👤 You:[/green] {content}\n"
-                elif role in ("assistant", "model"):
-                    history_text += f"[blue]{i}. 🤖 Assistant:[/blue] {content}\n"
-            
-            chat.write(Panel(
-                history_text,
-                title=f"Recent History (Last 10/{len(history)})",
-                border_style="cyan"
-            ))
+        self._cmd_history(self.query_one("#chat-container", RichLog))
 
 
 def main() -> None:
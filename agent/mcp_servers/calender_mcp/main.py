@@ -1,21 +1,27 @@
-import sys
-from pathlib import Path
-
-_PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_PROJECT_ROOT))
-
+import orjson
 from fastmcp import FastMCP
 from agent.mcp_servers.calender_mcp import tools as call_tools
-from agent.mcp_servers.calender_mcp import services as cal_services
 
-cal_services.initialize_calendar_service()
+# Calendar service initializes lazily on the first tool call; see
+# mail_mcp/main.py for the rationale.
+
+def _orjson_serializer(data) -> str:
+    """Serialize tool results with orjson; stdlib json encodes the
+    dict-heavy payloads these tools return several times slower."""
+    return orjson.dumps(data, default=str).decode()
 
-mcp = FastMCP("calendar-mcp")
+
+try:
+    mcp = FastMCP("calendar-mcp", tool_serializer=_orjson_serializer)
+except TypeError:  # older fastmcp without tool_serializer
+    mcp = FastMCP("calendar-mcp")
 call_tools.mcp.bind(mcp)
 
 
-if __name__ == "__main__":
-    mcp.run(transport="http", host="127.0.0.1", port=6282, stateless_http=True)
+def main() -> None:
+    """Run the calendar MCP server: python -m agent.mcp_servers.calender_mcp.main"""
+    mcp.run(transport="http", host="127.0.0.1", port=6282, stateless_http=False)
 
 
+if __name__ == "__main__":
+    main()
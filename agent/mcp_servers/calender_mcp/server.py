@@ -5,16 +5,33 @@ A FastMCP server that exposes Google Calendar tools via HTTP.
 Run this server separately, and the orchestrator will connect to it.
 """
 
+import asyncio
+
+import orjson
 from fastmcp import FastMCP
-from typing import Optional, List
+from typing import Any, Optional, List
 from agent.mcp_servers.calender_mcp import services
 
+# The services layer uses googleapiclient, whose .execute() blocks on a
+# full HTTPS round trip. Tools are async and push that work onto a worker
+# thread so the server's event loop keeps serving concurrent requests.
+
+
+def _orjson_serializer(data: Any) -> str:
+    """Serialize tool results with orjson; event payloads run to kilobytes
+    and stdlib json encodes them several times slower."""
+    return orjson.dumps(data, default=str).decode()
+
+
 # Initialize FastMCP server
-mcp = FastMCP('Calendar Server')
+try:
+    mcp = FastMCP('Calendar Server', tool_serializer=_orjson_serializer)
+except TypeError:  # older fastmcp without tool_serializer
+    mcp = FastMCP('Calendar Server')
 
 
 @mcp.tool(description="List Google Calendar events in a time range with optional text search.")
-def list_events(
+async def list_events(
     calendar_id: str = "primary",
     time_min: Optional[str] = None,
     time_max: Optional[str] = None,
@@ -35,7 +52,8 @@ def list_events(
         dict: Dictionary containing list of events
     """
     try:
-        items = services.list_events(
+        items = await asyncio.to_thread(
+            services.list_events,
             calendar_id=calendar_id,
             time_min=time_min,
             time_max=time_max,
@@ -48,7 +66,7 @@ def list_events(
 
 
 @mcp.tool(description="Create a Google Calendar event.")
-def create_event(
+async def create_event(
     summary: str,
     start_time: str,
     end_time: str,
@@ -75,7 +93,8 @@ def create_event(
         dict: Created event information
     """
     try:
-        created = services.create_event(
+        created = await asyncio.to_thread(
+            services.create_event,
             summary=summary,
             start_time=start_time,
             end_time=end_time,
@@ -91,7 +110,7 @@ def create_event(
 
 
 @mcp.tool(description="Get a Google Calendar event by ID.")
-def get_event(event_id: str, calendar_id: str = "primary") -> dict:
+async def get_event(event_id: str, calendar_id: str = "primary") -> dict:
     """
     Get a Google Calendar event by ID.
     
@@ -103,14 +122,14 @@ def get_event(event_id: str, calendar_id: str = "primary") -> dict:
         dict: Event information
     """
     try:
-        event = services.get_event(event_id=event_id, calendar_id=calendar_id)
+        event = await asyncio.to_thread(services.get_event, event_id=event_id, calendar_id=calendar_id)
         return {"event": event}
     except Exception as e:
         return {"error": f"Failed to get event: {str(e)}"}
 
 
 @mcp.tool(description="Update a Google Calendar event by ID.")
-def update_event(
+async def update_event(
     event_id: str,
     calendar_id: str = "primary",
     summary: Optional[str] = None,
@@ -139,7 +158,8 @@ def update_event(
         dict: Updated event information
     """
     try:
-        updated = services.update_event(
+        updated = await asyncio.to_thread(
+            services.update_event,
             event_id=event_id,
             calendar_id=calendar_id,
             summary=summary,
@@ -156,7 +176,7 @@ def update_event(
 
 
 @mcp.tool(description="Delete a Google Calendar event by ID.")
-def delete_event(event_id: str, calendar_id: str = "primary") -> dict:
+async def delete_event(event_id: str, calendar_id: str = "primary") -> dict:
     """
     Delete a Google Calendar event by ID.
     
@@ -168,14 +188,79 @@ def delete_event(event_id: str, calendar_id: str = "primary") -> dict:
         dict: Deletion confirmation
     """
     try:
-        result = services.delete_event(event_id=event_id, calendar_id=calendar_id)
+        result = await asyncio.to_thread(services.delete_event, event_id=event_id, calendar_id=calendar_id)
         return result
     except Exception as e:
         return {"error": f"Failed to delete event: {str(e)}"}
 
 
+@mcp.tool(description="Create many Google Calendar events in one batched request.")
+async def create_events_batch(
+    events: List[dict],
+    calendar_id: str = "primary",
+    timezone: str = "UTC",
+) -> dict:
+    """
+    Create many calendar events at once.
+
+    Args:
+        events: List of event dicts, each with summary, start_time and
+            end_time plus optional timezone, description, attendees, location
+        calendar_id: Calendar ID (default: "primary")
+        timezone: Default timezone for events without their own
+
+    Returns:
+        dict: Created events and any per-event errors
+    """
+    try:
+        return await asyncio.to_thread(
+            services.batch_create_events,
+            events=events,
+            calendar_id=calendar_id,
+            timezone=timezone,
+        )
+    except Exception as e:
+        return {"error": f"Failed to create events batch: {str(e)}"}
+
+
+@mcp.tool(description="Get many Google Calendar events by ID in one batched request.")
+async def get_events_batch(event_ids: List[str], calendar_id: str = "primary") -> dict:
+    """
+    Fetch many calendar events by ID at once.
+
+    Args:
+        event_ids: The event IDs to fetch
+        calendar_id: Calendar ID (default: "primary")
+
+    Returns:
+        dict: Events keyed by input position and any per-event errors
+    """
+    try:
+        return await asyncio.to_thread(services.batch_get_events, event_ids=event_ids, calendar_id=calendar_id)
+    except Exception as e:
+        return {"error": f"Failed to get events batch: {str(e)}"}
+
+
+@mcp.tool(description="Delete many Google Calendar events by ID in one batched request.")
+async def delete_events_batch(event_ids: List[str], calendar_id: str = "primary") -> dict:
+    """
+    Delete many calendar events by ID at once.
+
+    Args:
+        event_ids: The event IDs to delete
+        calendar_id: Calendar ID (default: "primary")
+
+    Returns:
+        dict: Deleted event IDs and any per-event errors
+    """
+    try:
+        return await asyncio.to_thread(services.batch_delete_events, event_ids=event_ids, calendar_id=calendar_id)
+    except Exception as e:
+        return {"error": f"Failed to delete events batch: {str(e)}"}
+
+
 # Run the server when this file is executed directly
 if __name__ == "__main__":
     print("Starting Calendar MCP Server on http://127.0.0.1:6282/mcp")
-    mcp.run(transport="http", host="127.0.0.1", port=6282, stateless_http=True)
+    mcp.run(transport="http", host="127.0.0.1", port=6282, stateless_http=False)
 
@@ -1,45 +1,57 @@
-import threading
+import re
 from datetime import datetime
+from functools import cache, lru_cache
 from typing import Any, Dict, List, Optional
 
 from agent.clients.google import init_calendar_service
 
-_SERVICE_LOCK = threading.Lock()
-_STATE: Dict[str, Any] = {"service": None}
+
+@cache
+def _service() -> Any:
+    """Calendar service singleton; functools.cache replaces the old
+    lock-and-dict double-checked locking with one C-level lookup."""
+    return init_calendar_service(force=False)
 
 
 def initialize_calendar_service(force: bool = False) -> Any:
-    if _STATE["service"] is not None and not force:
-        return _STATE["service"]
-    with _SERVICE_LOCK:
-        if _STATE["service"] is not None and not force:
-            return _STATE["service"]
-        _STATE["service"] = init_calendar_service(force=force)
-        return _STATE["service"]
+    if force:
+        _service.cache_clear()
+        # Rebuild the underlying client singleton too, then re-memoize
+        init_calendar_service(force=True)
+    return _service()
 
 
 def _get_service() -> Any:
-    if _STATE["service"] is None:
-        return initialize_calendar_service()
-    return _STATE["service"]
+    return _service()
+
+
+# Trailing timezone designator: Z or a +hh:mm / -hhmm offset. One anchored
+# search replaces the old endswith/'+' in/count('-') triple, which also
+# misread date-only strings (two dashes) as having an offset.
+_TZ_RE = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
 
 
+@lru_cache(maxsize=4096)
 def _ensure_rfc3339(time_str: str) -> str:
     """
     Ensure time string is in RFC3339 format with timezone.
     Google Calendar API requires format like: 2025-11-09T00:00:00+05:30 or 2025-11-09T00:00:00Z
+
+    Memoized: list/update flows pass the same day boundaries repeatedly.
     """
-    if not time_str:
-        return time_str
-    
-    # If already has timezone info (ends with Z or has +/- offset), return as is
-    if time_str.endswith('Z') or '+' in time_str or time_str.count('-') > 2:
+    if not time_str or _TZ_RE.search(time_str):
         return time_str
-    
+
     # Add Z (UTC) suffix if no timezone specified
     return time_str + 'Z'
 
 
+def _event_time(time_str: str, timezone: str) -> Dict[str, str]:
+    """Build the start/end payload half in one place; create and update
+    each need two of these per call."""
+    return {"dateTime": _ensure_rfc3339(time_str), "timeZone": timezone}
+
+
 def list_events(
     calendar_id: str = "primary",
     time_min: Optional[str] = None,
@@ -91,8 +103,8 @@ def create_event(
     service = _get_service()
     event: Dict[str, Any] = {
         "summary": summary,
-        "start": {"dateTime": _ensure_rfc3339(start_time), "timeZone": timezone},
-        "end": {"dateTime": _ensure_rfc3339(end_time), "timeZone": timezone},
+        "start": _event_time(start_time, timezone),
+        "end": _event_time(end_time, timezone),
     }
     if description:
         event["description"] = description
@@ -123,20 +135,22 @@ def update_event(
     location: Optional[str] = None,
 ) -> Dict[str, Any]:
     service = _get_service()
-    current = service.events().get(calendarId=calendar_id, eventId=event_id).execute()  # type: ignore[attr-defined]
+    # PATCH takes only the changed fields, so the old get-mutate-update
+    # pair (two API round trips per edit) collapses into one request.
+    body: Dict[str, Any] = {}
     if summary is not None:
-        current["summary"] = summary
+        body["summary"] = summary
     if description is not None:
-        current["description"] = description
+        body["description"] = description
     if location is not None:
-        current["location"] = location
+        body["location"] = location
     if start_time is not None:
-        current["start"] = {"dateTime": _ensure_rfc3339(start_time), "timeZone": timezone}
+        body["start"] = _event_time(start_time, timezone)
     if end_time is not None:
-        current["end"] = {"dateTime": _ensure_rfc3339(end_time), "timeZone": timezone}
+        body["end"] = _event_time(end_time, timezone)
     if attendees is not None:
-        current["attendees"] = [{"email": e} for e in attendees]
-    updated = service.events().update(calendarId=calendar_id, eventId=event_id, body=current, sendUpdates="all").execute()  # type: ignore[attr-defined]
+        body["attendees"] = [{"email": e} for e in attendees]
+    updated = service.events().patch(calendarId=calendar_id, eventId=event_id, body=body, sendUpdates="all").execute()  # type: ignore[attr-defined]
     return updated
 
 
@@ -146,3 +160,100 @@ def delete_event(event_id: str, calendar_id: str = "primary") -> Dict[str, Any]:
     return {"deleted": True, "eventId": event_id}
 
 
+# Google caps calendar batch requests at 50 sub-requests each
+_BATCH_MAX = 50
+
+
+def _execute_batched(service: Any, requests: List[Any]) -> Dict[str, Any]:
+    """Send prepared API requests through /batch, chunked to the 50 cap.
+
+    One multipart HTTP round trip carries up to 50 sub-requests, so bulk
+    flows cost ~1 RTT per chunk instead of one per event. Results and
+    errors come back keyed by the request's position in the input list.
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    def _collect(request_id: str, response: Any, exception: Any) -> None:
+        if exception is not None:
+            errors[request_id] = str(exception)
+        else:
+            results[request_id] = response
+
+    for start in range(0, len(requests), _BATCH_MAX):
+        batch = service.new_batch_http_request(callback=_collect)
+        for offset, request in enumerate(requests[start:start + _BATCH_MAX], start):
+            batch.add(request, request_id=str(offset))
+        batch.execute()
+
+    return {"results": results, "errors": errors}
+
+
+def batch_create_events(
+    events: List[Dict[str, Any]],
+    calendar_id: str = "primary",
+    timezone: str = "UTC",
+) -> Dict[str, Any]:
+    """
+    Create many events in batched API calls.
+
+    Args:
+        events: List of event dicts; each needs summary, start_time and
+            end_time, and may carry timezone, description, attendees,
+            location (same fields as create_event)
+        calendar_id: Calendar ID (default: "primary")
+        timezone: Default timezone for events that don't set their own
+    """
+    service = _get_service()
+    requests = []
+    for e in events:
+        tz = e.get("timezone", timezone)
+        body: Dict[str, Any] = {
+            "summary": e.get("summary", ""),
+            "start": _event_time(e["start_time"], tz),
+            "end": _event_time(e["end_time"], tz),
+        }
+        if e.get("description"):
+            body["description"] = e["description"]
+        if e.get("location"):
+            body["location"] = e["location"]
+        if e.get("attendees"):
+            body["attendees"] = [{"email": a} for a in e["attendees"]]
+        requests.append(service.events().insert(calendarId=calendar_id, body=body, sendUpdates="all"))  # type: ignore[attr-defined]
+
+    outcome = _execute_batched(service, requests)
+    created = {
+        rid: {"id": r.get("id"), "htmlLink": r.get("htmlLink")}
+        for rid, r in outcome["results"].items()
+    }
+    return {"created": created, "errors": outcome["errors"]}
+
+
+def batch_get_events(
+    event_ids: List[str],
+    calendar_id: str = "primary",
+) -> Dict[str, Any]:
+    """Fetch many events by ID in batched API calls."""
+    service = _get_service()
+    requests = [
+        service.events().get(calendarId=calendar_id, eventId=eid)  # type: ignore[attr-defined]
+        for eid in event_ids
+    ]
+    return _execute_batched(service, requests)
+
+
+def batch_delete_events(
+    event_ids: List[str],
+    calendar_id: str = "primary",
+) -> Dict[str, Any]:
+    """Delete many events by ID in batched API calls."""
+    service = _get_service()
+    requests = [
+        service.events().delete(calendarId=calendar_id, eventId=eid, sendUpdates="all")  # type: ignore[attr-defined]
+        for eid in event_ids
+    ]
+    outcome = _execute_batched(service, requests)
+    deleted = [event_ids[int(rid)] for rid in outcome["results"]]
+    return {"deleted": deleted, "errors": outcome["errors"]}
+
+
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agent.mcp_servers.calender_mcp import services as cal_services
 
@@ -6,19 +6,21 @@ from agent.mcp_servers.calender_mcp import services as cal_services
 class _CalendarMcpBinder:
     def __init__(self) -> None:
         self._mcp: Any = None
-        self._pending: List[tuple] = []
+        # (func, description) pairs; description is the only kwarg the
+        # decorator takes, so there's no dict to build and unpack per tool
+        self._pending: List[Tuple[Any, Optional[str]]] = []
 
     def bind(self, mcp: Any) -> None:
         self._mcp = mcp
-        for func, kwargs in self._pending:
-            mcp.tool(**kwargs)(func)
+        for func, description in self._pending:
+            mcp.tool(description=description)(func)
         self._pending.clear()
 
     def tool(self, description: Optional[str] = None) -> Any:
         def decorator(func: Any) -> Any:
             if self._mcp is not None:
                 return self._mcp.tool(description=description)(func)
-            self._pending.append((func, {"description": description}))
+            self._pending.append((func, description))
             return func
 
         return decorator
@@ -132,3 +134,31 @@ def delete_event(event_id: str, calendar_id: str = "primary") -> Dict[str, Any]:
         return {"error": f"Failed to delete event: {str(e)}"}
 
 
+@mcp.tool(description="Create many Google Calendar events in one batched request.")
+def create_events_batch(
+    events: List[Dict[str, Any]],
+    calendar_id: str = "primary",
+    timezone: str = "UTC",
+) -> Dict[str, Any]:
+    try:
+        return cal_services.batch_create_events(events=events, calendar_id=calendar_id, timezone=timezone)
+    except Exception as e:
+        return {"error": f"Failed to create events batch: {str(e)}"}
+
+
+@mcp.tool(description="Get many Google Calendar events by ID in one batched request.")
+def get_events_batch(event_ids: List[str], calendar_id: str = "primary") -> Dict[str, Any]:
+    try:
+        return cal_services.batch_get_events(event_ids=event_ids, calendar_id=calendar_id)
+    except Exception as e:
+        return {"error": f"Failed to get events batch: {str(e)}"}
+
+
+@mcp.tool(description="Delete many Google Calendar events by ID in one batched request.")
+def delete_events_batch(event_ids: List[str], calendar_id: str = "primary") -> Dict[str, Any]:
+    try:
+        return cal_services.batch_delete_events(event_ids=event_ids, calendar_id=calendar_id)
+    except Exception as e:
+        return {"error": f"Failed to delete events batch: {str(e)}"}
+
+
@@ -5,16 +5,29 @@ A FastMCP server that exposes expense tracking tools via HTTP.
 Run this server separately, and the orchestrator will connect to it.
 """
 
+import orjson
 from fastmcp import FastMCP
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from agent.mcp_servers.expense_tracker_mcp import services
 
+# Tools are async: the services layer awaits httpx, so concurrent tool
+# calls overlap instead of serializing on a blocking requests session.
+
+def _orjson_serializer(data: Any) -> str:
+    """Serialize tool results with orjson; stdlib json encodes the
+    dict-heavy payloads these tools return several times slower."""
+    return orjson.dumps(data, default=str).decode()
+
+
 # Initialize FastMCP server
-mcp = FastMCP('Expense Tracker Server')
+try:
+    mcp = FastMCP('Expense Tracker Server', tool_serializer=_orjson_serializer)
+except TypeError:  # older fastmcp without tool_serializer
+    mcp = FastMCP('Expense Tracker Server')
 
 
 @mcp.tool(description="Add a new expense to the expense tracker.")
-def add_expense(
+async def add_expense(
     amount: float,
     description: str,
     email: str,
@@ -33,13 +46,31 @@ def add_expense(
         dict: The created expense data
     """
     try:
-        return services.add_expense(amount, description, email, expense_date)
+        return await services.add_expense(amount, description, email, expense_date)
     except Exception as e:
         return {"error": f"Failed to add expense: {str(e)}"}
 
 
+@mcp.tool(description="Add many expenses in one call.")
+async def add_expenses_bulk(items: List[Dict]) -> dict:
+    """
+    Add many expenses at once.
+    
+    Args:
+        items: List of expense dicts, each with amount, description and
+            email, plus an optional expense_date
+    
+    Returns:
+        dict: Created expenses and any per-item errors keyed by position
+    """
+    try:
+        return await services.add_expenses_bulk(items)
+    except Exception as e:
+        return {"error": f"Failed to add expenses in bulk: {str(e)}"}
+
+
 @mcp.tool(description="Update an existing expense by ID.")
-def update_expense(
+async def update_expense(
     expense_id: int,
     amount: Optional[float] = None,
     description: Optional[str] = None,
@@ -60,13 +91,13 @@ def update_expense(
         dict: The updated expense data
     """
     try:
-        return services.update_expense(expense_id, amount, description, email, expense_date)
+        return await services.update_expense(expense_id, amount, description, email, expense_date)
     except Exception as e:
         return {"error": f"Failed to update expense: {str(e)}"}
 
 
 @mcp.tool(description="Get a specific expense by ID.")
-def get_expense_by_id(expense_id: int) -> dict:
+async def get_expense_by_id(expense_id: int) -> dict:
     """
     Get a specific expense by ID.
     
@@ -77,13 +108,13 @@ def get_expense_by_id(expense_id: int) -> dict:
         dict: The expense data
     """
     try:
-        return services.get_expense_by_id(expense_id)
+        return await services.get_expense_by_id(expense_id)
     except Exception as e:
         return {"error": f"Failed to get expense: {str(e)}"}
 
 
 @mcp.tool(description="Get all expenses for a user with optional filtering.")
-def get_expenses(
+async def get_expenses(
     email: str,
     start_time: Optional[str] = None,
     end_time: Optional[str] = None
@@ -100,13 +131,13 @@ def get_expenses(
         dict: List of expenses matching the criteria
     """
     try:
-        return services.get_expenses(email, start_time, end_time)
+        return await services.get_expenses(email, start_time, end_time)
     except Exception as e:
         return {"error": f"Failed to get expenses: {str(e)}"}
 
 
 @mcp.tool(description="Get expenses within a specific time range.")
-def get_expenses_by_time_range(
+async def get_expenses_by_time_range(
     email: str,
     start_time: str,
     end_time: str
@@ -123,13 +154,13 @@ def get_expenses_by_time_range(
         dict: List of expenses within the time range
     """
     try:
-        return services.get_expenses_by_time_range(email, start_time, end_time)
+        return await services.get_expenses_by_time_range(email, start_time, end_time)
     except Exception as e:
         return {"error": f"Failed to get expenses by time range: {str(e)}"}
 
 
 @mcp.tool(description="Delete an expense by ID.")
-def delete_expense(expense_id: int) -> dict:
+async def delete_expense(expense_id: int) -> dict:
     """
     Delete an expense by ID.
     
@@ -140,13 +171,13 @@ def delete_expense(expense_id: int) -> dict:
         dict: Confirmation message
     """
     try:
-        return services.delete_expense(expense_id)
+        return await services.delete_expense(expense_id)
     except Exception as e:
         return {"error": f"Failed to delete expense: {str(e)}"}
 
 
 @mcp.tool(description="Check the health status of the expense tracker API.")
-def check_api_health() -> dict:
+async def check_api_health() -> dict:
     """
     Check the health status of the expense tracker API.
     
@@ -154,16 +185,17 @@ def check_api_health() -> dict:
         dict: API health status
     """
     try:
-        return services.check_api_health()
+        return await services.check_api_health()
     except Exception as e:
         return {"error": f"Failed to check API health: {str(e)}"}
 
 
 @mcp.tool(description="Search for expenses by description.")
-def search_expenses_by_description(
+async def search_expenses_by_description(
     email: str,
     description: str,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    offset: Optional[int] = None
 ) -> dict:
     """
     Search for expenses by description.
@@ -172,18 +204,19 @@ def search_expenses_by_description(
         email: Email address of the user
         description: Description to search for (partial matches supported)
         limit: Maximum number of results to return (default: 50, max: 100)
+        offset: Number of results to skip, for paging past the limit
     
     Returns:
         dict: List of matching expenses with search metadata
     """
     try:
-        return services.search_expenses_by_description(email, description, limit)
+        return await services.search_expenses_by_description(email, description, limit, offset)
     except Exception as e:
         return {"error": f"Failed to search expenses: {str(e)}"}
 
 
 @mcp.tool(description="Get API information and available endpoints.")
-def get_api_info() -> dict:
+async def get_api_info() -> dict:
     """
     Get API information and available endpoints.
     
@@ -191,7 +224,7 @@ def get_api_info() -> dict:
         dict: API information and available endpoints
     """
     try:
-        return services.get_api_info()
+        return await services.get_api_info()
     except Exception as e:
         return {"error": f"Failed to get API info: {str(e)}"}
 
@@ -199,5 +232,5 @@ def get_api_info() -> dict:
 # Run the server when this file is executed directly
 if __name__ == "__main__":
     print("Starting Expense Tracker MCP Server on http://127.0.0.1:6280/mcp")
-    mcp.run(transport="http", host="127.0.0.1", port=6280, stateless_http=True)
+    mcp.run(transport="http", host="127.0.0.1", port=6280, stateless_http=False)
 
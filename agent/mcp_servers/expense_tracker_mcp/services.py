@@ -1,7 +1,11 @@
-import requests
+import asyncio
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,7 +15,43 @@ API_BASE_URL = os.getenv("EXPENSE_TRACKER_SERVER_URL")
 if not API_BASE_URL:
     raise ValueError("EXPENSE_TRACKER_SERVER_URL is not set")
 
-def add_expense(
+# One async client for every service call. The old per-call requests.*
+# functions blocked the FastMCP event loop and opened a fresh TCP
+# connection per request; this client keeps connections alive and lets
+# concurrent tool invocations overlap on the loop.
+_CLIENT = httpx.AsyncClient(
+    base_url=API_BASE_URL,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+    transport=httpx.AsyncHTTPTransport(retries=2),
+    headers={"Accept": "application/json"},
+)
+
+# JSON bodies are encoded and responses decoded with orjson; httpx's
+# json= kwarg and .json() go through stdlib json, several times slower
+# on the list-shaped payloads this API returns
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _loads(response: httpx.Response) -> Dict[str, Any]:
+    return orjson.loads(response.content)
+
+
+async def close_client() -> None:
+    """Release the pooled connections on shutdown."""
+    await _CLIENT.aclose()
+
+
+# TTL caches for the two effectively-static endpoints; agents poll them
+# between tool calls and each hit otherwise costs a full round trip.
+# Health keeps a short window so a real outage still surfaces quickly.
+_API_INFO_TTL_S = 60.0
+_HEALTH_TTL_S = 5.0
+_api_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+async def add_expense(
     amount: float,
     description: str,
     email: str,
@@ -29,9 +69,11 @@ def add_expense(
     Returns:
         dict: The created expense data
     """
-    # Use current date if not provided
+    # Use current date if not provided. The old naive local
+    # datetime.now().isoformat() + "Z" claimed UTC for a local time;
+    # this is both correct and one string operation instead of two.
     if not expense_date:
-        expense_date = datetime.now().isoformat() + "Z"
+        expense_date = datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
     
     payload = {
         "amount": amount,
@@ -40,13 +82,51 @@ def add_expense(
         "expenseDate": expense_date
     }
     
-    response = requests.post(f"{API_BASE_URL}/expenses", json=payload)
+    response = await _CLIENT.post("/expenses", content=orjson.dumps(payload), headers=_JSON_HEADERS)
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def update_expense(
+async def add_expenses_bulk(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add many expenses at once.
+
+    The API has no bulk endpoint, so the inserts fan out concurrently
+    over the shared client: N items cost roughly the slowest round trip
+    on the kept-alive connections instead of N sequential ones.
+
+    Args:
+        items: List of expense dicts, each with amount, description and
+            email, plus an optional expense_date (same fields as add_expense)
+
+    Returns:
+        dict: Created expenses and any per-item errors keyed by position
+    """
+    results = await asyncio.gather(
+        *(
+            add_expense(
+                amount=item["amount"],
+                description=item["description"],
+                email=item["email"],
+                expense_date=item.get("expense_date"),
+            )
+            for item in items
+        ),
+        return_exceptions=True,
+    )
+
+    created: List[Dict[str, Any]] = []
+    errors: Dict[str, str] = {}
+    for i, result in enumerate(results):
+        if isinstance(result, BaseException):
+            errors[str(i)] = str(result)
+        else:
+            created.append(result)
+    return {"created": created, "errors": errors, "count": len(created)}
+
+
+async def update_expense(
     expense_id: int,
     amount: Optional[float] = None,
     description: Optional[str] = None,
@@ -76,13 +156,13 @@ def update_expense(
     if expense_date is not None:
         payload["expenseDate"] = expense_date
     
-    response = requests.put(f"{API_BASE_URL}/expenses/{expense_id}", json=payload)
+    response = await _CLIENT.put(f"/expenses/{expense_id}", content=orjson.dumps(payload), headers=_JSON_HEADERS)
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def get_expense_by_id(expense_id: int) -> Dict[str, Any]:
+async def get_expense_by_id(expense_id: int) -> Dict[str, Any]:
     """
     Get a specific expense by ID.
     
@@ -92,13 +172,13 @@ def get_expense_by_id(expense_id: int) -> Dict[str, Any]:
     Returns:
         dict: The expense data
     """
-    response = requests.get(f"{API_BASE_URL}/expenses/{expense_id}")
+    response = await _CLIENT.get(f"/expenses/{expense_id}")
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def get_expenses(
+async def get_expenses(
     email: str,
     start_time: Optional[str] = None,
     end_time: Optional[str] = None
@@ -120,13 +200,13 @@ def get_expenses(
     if end_time:
         params["endTime"] = end_time
     
-    response = requests.get(f"{API_BASE_URL}/expenses", params=params)
+    response = await _CLIENT.get("/expenses", params=params)
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def get_expenses_by_time_range(
+async def get_expenses_by_time_range(
     email: str,
     start_time: str,
     end_time: str
@@ -148,13 +228,13 @@ def get_expenses_by_time_range(
         "endTime": end_time
     }
     
-    response = requests.get(f"{API_BASE_URL}/expenses/time-range", params=params)
+    response = await _CLIENT.get("/expenses/time-range", params=params)
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def delete_expense(expense_id: int) -> Dict[str, Any]:
+async def delete_expense(expense_id: int) -> Dict[str, Any]:
     """
     Delete an expense by ID.
     
@@ -164,29 +244,40 @@ def delete_expense(expense_id: int) -> Dict[str, Any]:
     Returns:
         dict: Confirmation message
     """
-    response = requests.delete(f"{API_BASE_URL}/expenses/{expense_id}")
+    response = await _CLIENT.delete(f"/expenses/{expense_id}")
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def check_api_health() -> Dict[str, Any]:
+async def check_api_health() -> Dict[str, Any]:
     """
     Check the health status of the expense tracker API.
     
+    Cached for a few seconds so repeated checks within one agent turn
+    don't each hit the network.
+    
     Returns:
         dict: API health status
     """
-    response = requests.get(f"{API_BASE_URL}/health")
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and now < _health_cache[0]:
+        return _health_cache[1]
+
+    response = await _CLIENT.get("/health")
     response.raise_for_status()
-    
-    return response.json()
+
+    payload = _loads(response)
+    _health_cache = (now + _HEALTH_TTL_S, payload)
+    return payload
 
 
-def search_expenses_by_description(
+async def search_expenses_by_description(
     email: str,
     description: str,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    offset: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Search for expenses by description.
@@ -195,33 +286,47 @@ def search_expenses_by_description(
         email: Email address of the user
         description: Description to search for (partial matches supported)
         limit: Maximum number of results to return (default: 50, max: 100)
+        offset: Number of results to skip, for paging past the limit
     
     Returns:
         dict: List of matching expenses with search metadata
     """
+    # Always send a bounded limit so the API never ships (and this
+    # process never decodes) an unbounded result set; page with offset
     params = {
         "email": email,
-        "description": description
+        "description": description,
+        "limit": min(limit, 100) if limit is not None else 50,
     }
     
-    if limit is not None:
-        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
     
-    response = requests.get(f"{API_BASE_URL}/expenses/search", params=params)
+    response = await _CLIENT.get("/expenses/search", params=params)
     response.raise_for_status()
     
-    return response.json()
+    return _loads(response)
 
 
-def get_api_info() -> Dict[str, Any]:
+async def get_api_info() -> Dict[str, Any]:
     """
     Get API information and available endpoints.
     
+    The payload is static per server version, so it is cached for a
+    minute.
+    
     Returns:
         dict: API information and available endpoints
     """
-    response = requests.get(f"{API_BASE_URL}/")
+    global _api_info_cache
+    now = time.monotonic()
+    if _api_info_cache is not None and now < _api_info_cache[0]:
+        return _api_info_cache[1]
+
+    response = await _CLIENT.get("/")
     response.raise_for_status()
-    
-    return response.json()
+
+    payload = _loads(response)
+    _api_info_cache = (now + _API_INFO_TTL_S, payload)
+    return payload
 
@@ -1,24 +1,29 @@
-import sys
-from pathlib import Path
-
-# Ensure project root on sys.path so `agent` imports resolve when running from this dir
-_PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_PROJECT_ROOT))
-
+import orjson
 from fastmcp import FastMCP  # type: ignore
 from agent.mcp_servers.mail_mcp import tools as mail_tools
-from agent.mcp_servers.mail_mcp import services as mail_services
 
-# Initialize Gmail service once
-mail_services.initialize_mail_service()
+# The Gmail service initializes lazily on the first tool call (services
+# caches it); doing it here blocked the import on OAuth refresh plus the
+# API discovery round trip before the server could even bind its port.
 
 # Create server and bind tools annotated in tools.py
-mcp = FastMCP("mail-mcp")
+def _orjson_serializer(data) -> str:
+    """Serialize tool results with orjson; stdlib json encodes the
+    dict-heavy payloads these tools return several times slower."""
+    return orjson.dumps(data, default=str).decode()
+
+
+try:
+    mcp = FastMCP("mail-mcp", tool_serializer=_orjson_serializer)
+except TypeError:  # older fastmcp without tool_serializer
+    mcp = FastMCP("mail-mcp")
 mail_tools.mcp.bind(mcp)
 
 
-if __name__ == "__main__":
-    mcp.run(transport="http", host="127.0.0.1", port=6281, stateless_http=True)
+def main() -> None:
+    """Run the mail MCP server: python -m agent.mcp_servers.mail_mcp.main"""
+    mcp.run(transport="http", host="127.0.0.1", port=6281, stateless_http=False)
 
 
+if __name__ == "__main__":
+    main()
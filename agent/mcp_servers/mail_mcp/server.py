@@ -5,16 +5,31 @@ A FastMCP server that exposes Gmail tools via HTTP.
 Run this server separately, and the orchestrator will connect to it.
 """
 
+import asyncio
+
+import orjson
 from fastmcp import FastMCP
-from typing import Optional, List
+from typing import Any, Optional, List
 from agent.mcp_servers.mail_mcp import services
 
+# Tools run the blocking googleapiclient calls on worker threads so the
+# server's event loop keeps serving concurrent requests.
+
+def _orjson_serializer(data: Any) -> str:
+    """Serialize tool results with orjson; stdlib json encodes the
+    dict-heavy payloads these tools return several times slower."""
+    return orjson.dumps(data, default=str).decode()
+
+
 # Initialize FastMCP server
-mcp = FastMCP('Mail Server')
+try:
+    mcp = FastMCP('Mail Server', tool_serializer=_orjson_serializer)
+except TypeError:  # older fastmcp without tool_serializer
+    mcp = FastMCP('Mail Server')
 
 
 @mcp.tool(description="Read recent Gmail emails with optional query and labels.")
-def read_emails(
+async def read_emails(
     query: Optional[str] = None,
     max_results: int = 10,
     label_ids: Optional[List[str]] = None,
@@ -31,14 +46,14 @@ def read_emails(
         dict: Dictionary containing list of messages
     """
     try:
-        messages = services.read_emails(query=query, max_results=max_results, label_ids=label_ids)
+        messages = await asyncio.to_thread(services.read_emails, query=query, max_results=max_results, label_ids=label_ids)
         return {"messages": messages}
     except Exception as e:
         return {"error": f"Failed to read emails: {str(e)}"}
 
 
 @mcp.tool(description="Send an email via Gmail.")
-def send_email(
+async def send_email(
     to: str,
     subject: str,
     body: str,
@@ -59,14 +74,14 @@ def send_email(
         dict: Sent email information
     """
     try:
-        result = services.send_email(to=to, subject=subject, body=body, cc=cc, bcc=bcc)
+        result = await asyncio.to_thread(services.send_email, to=to, subject=subject, body=body, cc=cc, bcc=bcc)
         return {"sent": result}
     except Exception as e:
         return {"error": f"Failed to send email: {str(e)}"}
 
 
 @mcp.tool(description="Delete an email by moving it to trash.")
-def delete_email(message_id: str) -> dict:
+async def delete_email(message_id: str) -> dict:
     """
     Delete an email by message ID (moves to trash).
     
@@ -77,14 +92,14 @@ def delete_email(message_id: str) -> dict:
         dict: Deletion confirmation
     """
     try:
-        result = services.delete_email(message_id=message_id)
+        result = await asyncio.to_thread(services.delete_email, message_id=message_id)
         return result
     except Exception as e:
         return {"error": f"Failed to delete email: {str(e)}"}
 
 
 @mcp.tool(description="Mark an email as read.")
-def mark_email_read(message_id: str) -> dict:
+async def mark_email_read(message_id: str) -> dict:
     """
     Mark an email as read.
     
@@ -95,14 +110,14 @@ def mark_email_read(message_id: str) -> dict:
         dict: Update confirmation
     """
     try:
-        result = services.mark_email_read(message_id=message_id)
+        result = await asyncio.to_thread(services.mark_email_read, message_id=message_id)
         return result
     except Exception as e:
         return {"error": f"Failed to mark email as read: {str(e)}"}
 
 
 @mcp.tool(description="Mark an email as unread.")
-def mark_email_unread(message_id: str) -> dict:
+async def mark_email_unread(message_id: str) -> dict:
     """
     Mark an email as unread.
     
@@ -113,14 +128,14 @@ def mark_email_unread(message_id: str) -> dict:
         dict: Update confirmation
     """
     try:
-        result = services.mark_email_unread(message_id=message_id)
+        result = await asyncio.to_thread(services.mark_email_unread, message_id=message_id)
         return result
     except Exception as e:
         return {"error": f"Failed to mark email as unread: {str(e)}"}
 
 
 @mcp.tool(description="List all attachments in an email.")
-def list_attachments(message_id: str) -> dict:
+async def list_attachments(message_id: str) -> dict:
     """
     List all attachments in an email message.
     
@@ -131,14 +146,14 @@ def list_attachments(message_id: str) -> dict:
         dict: List of attachments with metadata
     """
     try:
-        attachments = services.list_attachments(message_id=message_id)
+        attachments = await asyncio.to_thread(services.list_attachments, message_id=message_id)
         return {"attachments": attachments, "count": len(attachments)}
     except Exception as e:
         return {"error": f"Failed to list attachments: {str(e)}"}
 
 
 @mcp.tool(description="Download an email attachment to the local machine.")
-def download_attachment(
+async def download_attachment(
     message_id: str,
     attachment_id: str,
     filename: str,
@@ -157,7 +172,8 @@ def download_attachment(
         dict: Download confirmation with file path
     """
     try:
-        result = services.download_attachment(
+        result = await asyncio.to_thread(
+            services.download_attachment,
             message_id=message_id,
             attachment_id=attachment_id,
             filename=filename,
@@ -171,5 +187,5 @@ def download_attachment(
 # Run the server when this file is executed directly
 if __name__ == "__main__":
     print("Starting Mail MCP Server on http://127.0.0.1:6281/mcp")
-    mcp.run(transport="http", host="127.0.0.1", port=6281, stateless_http=True)
+    mcp.run(transport="http", host="127.0.0.1", port=6281, stateless_http=False)
 
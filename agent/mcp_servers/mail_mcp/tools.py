@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, Tuple
 
 from agent.mcp_servers.mail_mcp import services as mail_services
 
@@ -12,19 +12,21 @@ class _MailMcpServer:
 
     def __init__(self) -> None:
         self._mcp: Any = None
-        self._pending: List[tuple] = []
+        # (func, description) pairs; description is the only kwarg the
+        # decorator takes, so there's no dict to build and unpack per tool
+        self._pending: List[Tuple[Any, Optional[str]]] = []
 
     def bind(self, mcp: Any) -> None:
         self._mcp = mcp
-        for func, kwargs in self._pending:
-            mcp.tool(**kwargs)(func)
+        for func, description in self._pending:
+            mcp.tool(description=description)(func)
         self._pending.clear()
 
     def tool(self, description: Optional[str] = None) -> Any:
         def decorator(func: Any) -> Any:
             if self._mcp is not None:
                 return self._mcp.tool(description=description)(func)
-            self._pending.append((func, {"description": description}))
+            self._pending.append((func, description))
             return func
 
         return decorator
@@ -1,5 +1,5 @@
 from langgraph.graph import StateGraph, START, END
-from agent.agents import query_rewriter, router_agent
+from agent.agents import rewrite_and_route
 from agent.states.assistant_state import AssistantState
 from agent.agents.master import handle_master
 from agent.schema.init_resume_agent_graph import build_resume_subgraph
@@ -33,36 +33,28 @@ I can handle the following categories:
 def build_graph():
     """
     Build the main assistant graph with:
-    - Query rewriter (for master agent queries)
-    - Router (categorizes the query)
+    - Rewrite-and-route (rewrites the query and categorizes it in one LLM call)
     - Master agent (handles mail, calendar, etc.)
     - Resume subgraph (handles resume preparation with its own query rewriter)
     - None handler (for unsupported categories)
     """
     graph = StateGraph(AssistantState)
-    
+
     # Add nodes
-    graph.add_node('query_rewriter', query_rewriter.rewrite_node)
-    graph.add_node('router', router_agent.router_node)
+    graph.add_node('rewrite_and_route', rewrite_and_route.rewrite_and_route_node)
     graph.add_node('master', handle_master)
     graph.add_node('none', no_category_handler)
-    
+
     # Add resume subgraph as a node
     resume_subgraph = build_resume_subgraph()
     graph.add_node('resume', resume_subgraph)
-    
-    # Set entry point and flow
-    # graph.set_entry_point('query_rewriter')
-    # graph.add_edge(START, 'query_rewriter')
-    # graph.add_edge('query_rewriter', 'router')
 
-    graph.set_entry_point('query_rewriter')
-    graph.add_edge(START, 'query_rewriter')
-    graph.add_edge('query_rewriter', 'router')
-    
-    # Conditional routing from router
+    graph.set_entry_point('rewrite_and_route')
+    graph.add_edge(START, 'rewrite_and_route')
+
+    # Conditional routing from the fused preprocessor
     graph.add_conditional_edges(
-        'router',
+        'rewrite_and_route',
         _route_decider,
         {
             'master': 'master',
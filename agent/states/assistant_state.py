@@ -1,4 +1,4 @@
-from typing import List, Literal, TypedDict, Optional
+from typing import Any, List, Literal, TypedDict, Optional
 
 
 class Message(TypedDict):
@@ -7,8 +7,14 @@ class Message(TypedDict):
     name: Optional[str]  # Optional field for tool name
 
 
-class AssistantState(TypedDict):
+class AssistantState(TypedDict, total=False):
     category_to_be_served: str
     query_to_be_served: str
     history: List[Message]
-    response: str
\ No newline at end of file
+    response: str
+    # Already-converted LangChain messages from prior turns, kept byte-stable
+    # so the provider's prompt-prefix cache can hit; managed by handle_master
+    _lc_messages_prefix: List[Any]
+    # Optional callback (sync or async) receiving response text chunks as
+    # the supervisor streams its final answer
+    _on_token: Any
\ No newline at end of file
@@ -8,7 +8,7 @@ import json
 from dotenv import load_dotenv
 
 from .database import get_db_connection, get_db_cursor, init_db
-from .models import EvalResultCreate, EvalResultResponse
+from .models import EvalResultCreate, EvalResultBatchCreate, EvalResultResponse
 
 load_dotenv()
 
@@ -100,6 +100,45 @@ def create_eval_result(result: EvalResultCreate):
         raise HTTPException(status_code=500, detail=f"Failed to insert eval result: {str(e)}")
 
 
+@app.post("/evals/batch")
+def create_eval_results_batch(batch: EvalResultBatchCreate):
+    """Insert several eval results in one round trip"""
+    if not batch.items:
+        return {"inserted": 0}
+    try:
+        with get_db_connection() as conn:
+            cursor = get_db_cursor(conn)
+
+            insert_sql = """
+            INSERT INTO eval_results
+                (test_name, category, status, score, execution_time_ms, user_input, agent_output, justification, improvements, error_message, metadata)
+            VALUES
+                (%(test_name)s, %(category)s, %(status)s, %(score)s, %(execution_time_ms)s, %(user_input)s, %(agent_output)s, %(justification)s, %(improvements)s, %(error_message)s, %(metadata)s::jsonb)
+            """
+
+            cursor.executemany(insert_sql, [
+                {
+                    'test_name': result.test_name,
+                    'category': result.category,
+                    'status': result.status,
+                    'score': result.score,
+                    'execution_time_ms': result.execution_time_ms,
+                    'user_input': result.user_input[:5000] if result.user_input else None,
+                    'agent_output': result.agent_output[:5000] if result.agent_output else None,
+                    'justification': result.justification[:2000] if result.justification else None,
+                    'improvements': result.improvements[:2000] if result.improvements else None,
+                    'error_message': result.error_message,
+                    'metadata': json.dumps(result.metadata)
+                }
+                for result in batch.items
+            ])
+
+            return {"inserted": len(batch.items)}
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to insert eval results: {str(e)}")
+
+
 @app.get("/evals", response_model=List[EvalResultResponse])
 def get_eval_results(
     category: Optional[str] = None,
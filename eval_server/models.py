@@ -1,6 +1,6 @@
 """Pydantic models for API"""
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
@@ -19,6 +19,11 @@ class EvalResultCreate(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
+class EvalResultBatchCreate(BaseModel):
+    """Model for creating several eval results in one request"""
+    items: List[EvalResultCreate] = Field(..., description="Eval results to insert")
+
+
 class EvalResultResponse(BaseModel):
     """Model for eval result response"""
     id: int